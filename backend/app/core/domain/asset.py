@@ -133,6 +133,21 @@ class Asset:
 
         return result
 
+    @classmethod
+    def from_row(cls, ticker: str, **fields: Any) -> 'Asset':
+        """Create an asset from a row of already converted values.
+
+        Args:
+            ticker: Stock/ETF ticker symbol
+            **fields: Attribute values, assigned in one update without validation
+
+        Returns:
+            Asset instance
+        """
+        asset = cls(ticker=ticker)
+        asset.__dict__.update(fields)
+        return asset
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Asset':
         """Create an asset from a dictionary.
@@ -45,6 +45,23 @@ class DataProvider(ABC):
         """
         pass
 
+    def get_company_info_batch(
+            self,
+            tickers: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get company information for multiple tickers.
+
+        Providers that can overlap or batch requests should override this;
+        the default performs one lookup per ticker.
+
+        Args:
+            tickers: List of Stock/ETF ticker symbols
+
+        Returns:
+            Dictionary mapping ticker symbols to company information
+        """
+        return {ticker: self.get_company_info(ticker) for ticker in tickers}
+
     @abstractmethod
     def search_tickers(
             self,
@@ -111,12 +111,14 @@ class StorageProvider(ABC):
     @abstractmethod
     def list_reports(
             self,
-            portfolio_id: Optional[str] = None
+            portfolio_id: Optional[str] = None,
+            limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """List all reports, optionally filtered by portfolio.
 
         Args:
             portfolio_id: Optional portfolio ID to filter by
+            limit: Optional maximum number of reports to return, newest first
 
         Returns:
             List of dictionaries with report metadata
@@ -158,12 +160,14 @@ class StorageProvider(ABC):
     @abstractmethod
     def list_optimization_results(
             self,
-            portfolio_id: Optional[str] = None
+            portfolio_id: Optional[str] = None,
+            limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """List all optimization results, optionally filtered by portfolio.
 
         Args:
             portfolio_id: Optional portfolio ID to filter by
+            limit: Optional maximum number of optimization results to return, newest first
 
         Returns:
             List of dictionaries with optimization result metadata
@@ -7,9 +7,11 @@ import logging
 import pickle
 import json
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union, Any
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional, Union, Any
 
 import pandas as pd
 import numpy as np
@@ -18,6 +20,37 @@ import requests
 from app.core.interfaces.data_provider import DataProvider
 from app.core.interfaces.cache_provider import CacheProvider
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import yfinance as yf
+    _HAS_YF = True
+except ImportError:
+    yf = None
+    _HAS_YF = False
+
+
+def _load_response_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed
+
+    Args:
+        response: HTTP response with a JSON body
+
+    Returns:
+        Decoded JSON payload
+    """
+    if orjson is not None:
+        # orjson parses the raw bytes directly and skips the text decoding step
+        return orjson.loads(response.content)
+    return response.json()
+
 
 class DataFetcherService(DataProvider):
     """
@@ -25,6 +58,9 @@ class DataFetcherService(DataProvider):
     Implements the DataProvider interface.
     """
 
+    # Maximum number of Alpha Vantage responses kept in memory
+    AV_MEMO_SIZE = 1024
+
     def __init__(
             self,
             cache_provider: CacheProvider,
@@ -42,6 +78,10 @@ class DataFetcherService(DataProvider):
         self.api_call_counts = {'yfinance': 0, 'alpha_vantage': 0}
         self.api_limits = {'alpha_vantage': 500}
 
+        # In-process LRU of Alpha Vantage responses keyed by _av_key, as (time.monotonic() expiry, frame);
+        # entries expire with the same cache_expiry_days as the cache provider
+        self._av_memo: OrderedDict[Tuple[str, str, str, str], Tuple[float, pd.DataFrame]] = OrderedDict()
+
         # Load API keys from environment variables
         self.api_keys = {
             'alpha_vantage': os.environ.get('ALPHA_VANTAGE_API_KEY', '')
@@ -114,8 +154,10 @@ class DataFetcherService(DataProvider):
         if start_date is None:
             start_date = (datetime.now() - timedelta(days=5 * 365)).strftime('%Y-%m-%d')
 
-        # Check cache
-        if not force_refresh:
+        # Check cache; a forced refresh also bypasses the in-process Alpha Vantage memo
+        if force_refresh:
+            self._av_memo.pop(self._av_key(corrected_ticker, start_date, end_date, interval), None)
+        else:
             cached_data = self.cache_provider.get(cache_key)
             if cached_data is not None:
                 logging.info(f"Loading {original_ticker} data from cache")
@@ -196,6 +238,33 @@ class DataFetcherService(DataProvider):
 
             return {}
 
+    def get_company_info_batch(
+            self,
+            tickers: List[str],
+            provider: str = 'yfinance',
+            max_workers: int = 8
+    ) -> Dict[str, Dict]:
+        """
+        Get company information for several tickers concurrently
+
+        Args:
+            tickers: List of Stock/ETF tickers
+            provider: Data provider
+            max_workers: Maximum number of requests in flight at the same time
+
+        Returns:
+            Dictionary {ticker: company information}
+        """
+        unique_tickers = list(dict.fromkeys(tickers))
+
+        if not unique_tickers:
+            return {}
+
+        # Each lookup is network-bound, so overlap them; the pool size caps concurrent requests
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_tickers))) as executor:
+            infos = executor.map(lambda t: self.get_company_info(t, provider), unique_tickers)
+            return dict(zip(unique_tickers, infos))
+
     def search_tickers(self, query: str, limit: int = 10, provider: str = 'yfinance') -> List[Dict]:
         """
         Search tickers by query
@@ -396,10 +465,13 @@ class DataFetcherService(DataProvider):
             logging.info(f"Loaded ETF {etf_ticker} constituents from cache")
             return cached_data
 
+        if not _HAS_YF:
+            logging.error("yfinance is not installed. Install it with pip install yfinance")
+            return []
+
         constituents = []
 
         try:
-            import yfinance as yf
             from bs4 import BeautifulSoup
 
             # Try to get composition via Yahoo Finance
@@ -589,10 +661,10 @@ class DataFetcherService(DataProvider):
         if ticker_mapping:
             logging.info(f"Tickers have been replaced for data requests: {ticker_mapping}")
 
-        if provider == 'yfinance' and len(corrected_tickers) > 1:
+        if provider == 'yfinance' and len(corrected_tickers) > 1 and not _HAS_YF:
+            logging.error("yfinance is not installed. Install it with pip install yfinance")
+        elif provider == 'yfinance' and len(corrected_tickers) > 1:
             try:
-                import yfinance as yf
-
                 if end_date is None:
                     end_date = datetime.now().strftime('%Y-%m-%d')
 
@@ -644,8 +716,6 @@ class DataFetcherService(DataProvider):
                             )
 
                 return results
-            except ImportError:
-                logging.error("yfinance is not installed. Install it with pip install yfinance")
             except Exception as e:
                 logging.error(f"Error while loading data in batch: {e}")
 
@@ -663,6 +733,62 @@ class DataFetcherService(DataProvider):
 
         return results
 
+    def get_batch_data_arrow(
+        self,
+        tickers: List[str],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        provider: str = 'yfinance'
+    ) -> 'pa.Table':
+        """
+        Get data for multiple tickers as a single long-format Arrow table
+
+        Convenience wrapper over get_batch_data for consumers that want one columnar table
+        (e.g. to write Parquet). The per-ticker DataFrames are still built first and then
+        converted, so this uses more memory than get_batch_data, not less.
+
+        Args:
+            tickers: List of tickers
+            start_date: Start date
+            end_date: End date
+            provider: Data provider
+
+        Returns:
+            pyarrow.Table with columns ticker, date, Open, High, Low, Close, Adj Close, Volume
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            logging.error("pyarrow is not installed. Install it with pip install pyarrow")
+            raise
+
+        price_columns = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
+        schema = pa.schema(
+            [('ticker', pa.string()), ('date', pa.timestamp('ns'))] +
+            [(col, pa.float64()) for col in price_columns]
+        )
+
+        tables = []
+        for ticker, data in self.get_batch_data(tickers, start_date, end_date, provider).items():
+            if data.empty:
+                continue
+
+            prices = data.reindex(columns=price_columns)
+            dates = pd.DatetimeIndex(prices.index)
+            if dates.tz is not None:
+                dates = dates.tz_convert(None)
+
+            columns = {
+                'ticker': pa.array([ticker] * len(prices), type=pa.string()),
+                'date': pa.array(dates.to_numpy(dtype='datetime64[ns]'), type=pa.timestamp('ns'))
+            }
+            for col in price_columns:
+                columns[col] = pa.array(prices[col].to_numpy(dtype=np.float64), type=pa.float64())
+
+            tables.append(pa.table(columns, schema=schema))
+
+        return pa.concat_tables(tables) if tables else schema.empty_table()
+
     def get_fundamental_data(self, ticker: str, data_type: str = 'income') -> pd.DataFrame:
         """
         Get fundamental financial data
@@ -682,9 +808,11 @@ class DataFetcherService(DataProvider):
             logging.info(f"Loading fundamental data {data_type} for {ticker} from cache")
             return cached_data
 
-        try:
-            import yfinance as yf
+        if not _HAS_YF:
+            logging.error("yfinance is not installed. Install it with pip install yfinance")
+            return pd.DataFrame()
 
+        try:
             # Increase the API call counter
             self.api_call_counts['yfinance'] += 1
 
@@ -709,9 +837,6 @@ class DataFetcherService(DataProvider):
             self.cache_provider.set(cache_key, df, timedelta(days=30))
 
             return df
-        except ImportError:
-            logging.error("yfinance is not installed. Install it with pip install yfinance")
-            return pd.DataFrame()
         except Exception as e:
             logging.error(f"Error in getting fundamental data for {ticker}: {e}")
             return pd.DataFrame()
@@ -726,6 +851,7 @@ class DataFetcherService(DataProvider):
         if tickers is None:
             # Clear all cache
             self.cache_provider.clear()
+            self._av_memo.clear()
             logging.info("The cache has been completely cleared.")
         else:
             # Clear cache for specific tickers
@@ -735,6 +861,10 @@ class DataFetcherService(DataProvider):
                 keys_to_clear = self.cache_provider.get_keys(pattern)
                 for key in keys_to_clear:
                     self.cache_provider.delete(key)
+
+                corrected_ticker = ticker.replace('.', '-')
+                for memo_key in [k for k in self._av_memo if k[0] == corrected_ticker]:
+                    del self._av_memo[memo_key]
             logging.info(f"Cache cleared for tickers: {tickers}")
 
     # Helper methods for fetching data from specific providers
@@ -751,9 +881,11 @@ class DataFetcherService(DataProvider):
         Returns:
             DataFrame with historical data
         """
-        try:
-            import yfinance as yf
+        if not _HAS_YF:
+            logging.error("yfinance is not installed. Install it with pip install yfinance")
+            return pd.DataFrame()
 
+        try:
             original_ticker = ticker
             corrected_ticker = ticker.replace('.', '-') if '.' in ticker else ticker
 
@@ -783,23 +915,26 @@ class DataFetcherService(DataProvider):
                     )
                     return pd.DataFrame()
 
-                # Check and adjust index if it is not DatetimeIndex
-                if not isinstance(data.index, pd.DatetimeIndex):
+                # Check and adjust index if it is not datetime-like
+                if data.index.dtype.kind != 'M':
                     try:
                         data.index = pd.to_datetime(data.index)
                     except Exception as e:
                         logging.warning(f"Failed to convert index to DatetimeIndex: {e}")
 
-                # Ensure required columns exist
-                required_columns = ['Open', 'High', 'Low', 'Close', 'Volume']
-                for col in required_columns:
-                    if col not in data.columns:
-                        if col == 'Volume' and 'volume' in data.columns:
-                            data['Volume'] = data['volume']
-                        else:
-                            data[col] = np.nan
+                # Ensure required columns exist, resolving all of them with one set difference
+                columns = set(data.columns)
+                missing = {'Open', 'High', 'Low', 'Close', 'Volume'} - columns
+
+                if missing:
+                    if 'Volume' in missing and 'volume' in columns:
+                        data.rename(columns={'volume': 'Volume'}, inplace=True)
+                        missing.discard('Volume')
 
-                if 'Adj Close' not in data.columns:
+                    for col in missing:
+                        data[col] = np.nan
+
+                if 'Adj Close' not in columns:
                     data['Adj Close'] = data['Close']
 
                 return data
@@ -809,9 +944,6 @@ class DataFetcherService(DataProvider):
                     f"Error retrieving data via yfinance for {original_ticker} (request as {corrected_ticker}): {e}"
                 )
                 return pd.DataFrame()
-        except ImportError:
-            logging.error("yfinance is not installed. Install it with pip install yfinance")
-            return pd.DataFrame()
         except Exception as e:
             logging.error(f"Error retrieving data via yfinance for {ticker}: {e}")
             return pd.DataFrame()
@@ -833,17 +965,22 @@ class DataFetcherService(DataProvider):
             logging.error("API key for Alpha Vantage not installed")
             return pd.DataFrame()
 
+        # The response is a pure function of the request, so identical calls are served in-process
+        memo_key = self._av_key(ticker, start_date, end_date, interval)
+        memoized = self._av_memo.get(memo_key)
+        if memoized is not None:
+            expires_at, memoized_df = memoized
+            if time.monotonic() < expires_at:
+                self._av_memo.move_to_end(memo_key)
+                return memoized_df.copy()
+            del self._av_memo[memo_key]
+
         if self.api_call_counts['alpha_vantage'] >= self.api_limits['alpha_vantage']:
             logging.warning("Alpha Vantage API call limit reached")
             return pd.DataFrame()
 
         original_ticker = ticker
-        corrected_ticker = ticker.replace('.', '-') if '.' in ticker else ticker
-
-        if corrected_ticker != original_ticker:
-            logging.info(
-                f"Use corrected ticker {corrected_ticker} to query Alpha Vantage {original_ticker}"
-            )
+        corrected_ticker = memo_key[0]
 
         interval_map = {
             '1d': 'daily',
@@ -868,7 +1005,7 @@ class DataFetcherService(DataProvider):
             response = requests.get(base_url, params=params)
             response.raise_for_status()
 
-            data = response.json()
+            data = _load_response_json(response)
 
             if "Error Message" in data:
                 logging.error(
@@ -904,12 +1041,19 @@ class DataFetcherService(DataProvider):
 
             df.index = pd.to_datetime(df.index)
 
-            df = df.sort_index()
+            # Alpha Vantage returns newest-first, so a reversed view is enough in the common case
+            if not df.index.is_monotonic_increasing:
+                df = df.iloc[::-1] if df.index.is_monotonic_decreasing else df.sort_index()
 
-            if start_date:
-                df = df[df.index >= start_date]
-            if end_date:
-                df = df[df.index <= end_date]
+            # The index is ascending here, so the date window is a single slice
+            df = df.loc[start_date or None:end_date or None]
+
+            if not df.empty:
+                # Keep a private copy so callers mutating the result cannot corrupt the memo
+                expires_at = time.monotonic() + self.cache_expiry_days * 86400
+                self._av_memo[memo_key] = (expires_at, df.copy())
+                if len(self._av_memo) > self.AV_MEMO_SIZE:
+                    self._av_memo.popitem(last=False)
 
             return df
         except requests.exceptions.RequestException as e:
@@ -919,6 +1063,27 @@ class DataFetcherService(DataProvider):
             logging.error(f"Error processing Alpha Vantage data for {original_ticker}: {e}")
             return pd.DataFrame()
 
+    @staticmethod
+    def _av_key(
+            ticker: str,
+            start_date: Optional[str],
+            end_date: Optional[str],
+            interval: str
+    ) -> Tuple[str, str, str, str]:
+        """
+        Build a hashable key for an Alpha Vantage time series request
+
+        Args:
+            ticker: Stock/ETF ticker
+            start_date: Start date
+            end_date: End date
+            interval: Data interval
+
+        Returns:
+            Tuple (corrected_ticker, start_date, end_date, interval)
+        """
+        return ticker.replace('.', '-'), start_date or '', end_date or '', interval
+
     def _get_yfinance_company_info(self, ticker: str) -> Dict:
         """
         Get company information via yfinance
@@ -929,9 +1094,11 @@ class DataFetcherService(DataProvider):
         Returns:
             Dictionary with company information
         """
-        try:
-            import yfinance as yf
+        if not _HAS_YF:
+            logging.error("yfinance is not installed. Install it with pip install yfinance")
+            return {}
 
+        try:
             # Check if the ticker contains a dot and create a corrected version for the API
             original_ticker = ticker
             corrected_ticker = ticker.replace('.', '-') if '.' in ticker else ticker
@@ -973,9 +1140,6 @@ class DataFetcherService(DataProvider):
                     normalized_info[self._camel_to_snake(metric)] = info[metric]
 
             return normalized_info
-        except ImportError:
-            logging.error("yfinance is not installed. Install it with pip install yfinance")
-            return {}
         except Exception as e:
             logging.error(f"Error when getting company information via yfinance for {original_ticker}: {e}")
             return {}
@@ -1021,7 +1185,7 @@ class DataFetcherService(DataProvider):
             response = requests.get(base_url, params=params)
             response.raise_for_status()
 
-            data = response.json()
+            data = _load_response_json(response)
 
             if not data or ("Error Message" in data) or len(data.keys()) <= 1:
                 logging.warning(f"Alpha Vantage did not return data for {original_ticker} (queried as {corrected_ticker})")
@@ -1093,7 +1257,7 @@ class DataFetcherService(DataProvider):
             response = requests.get(base_url, params=params)
             response.raise_for_status()
 
-            data = response.json()
+            data = _load_response_json(response)
 
             results = []
             if 'bestMatches' in data:
@@ -1142,9 +1306,6 @@ class DataFetcherService(DataProvider):
             List of dictionaries with information about found tickers
         """
         try:
-            import yfinance as yf
-            import json
-
             url = f"https://query2.finance.yahoo.com/v1/finance/search?q={query}&quotesCount={limit}&newsCount=0"
             headers = {'User-Agent': 'Mozilla/5.0'}
 
@@ -1153,7 +1314,7 @@ class DataFetcherService(DataProvider):
                 logging.error(f"Error requesting Yahoo Finance API: {response.status_code}")
                 return []
 
-            data = response.json()
+            data = _load_response_json(response)
 
             results = []
             if 'quotes' in data and data['quotes']:
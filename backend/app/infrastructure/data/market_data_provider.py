@@ -68,6 +68,24 @@ class MarketDataProvider(ABC):
         """
         pass
 
+    def get_company_info_batch(
+        self,
+        tickers: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get company information for multiple tickers.
+
+        Optional method: the default performs one lookup per ticker,
+        providers that can overlap or batch requests should override it.
+
+        Args:
+            tickers: List of stock symbols
+
+        Returns:
+            Dictionary mapping each ticker to its company information
+        """
+        return {ticker: self.get_company_info(ticker) for ticker in tickers}
+
     @abstractmethod
     def get_batch_prices(
         self,
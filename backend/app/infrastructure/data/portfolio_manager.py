@@ -2,8 +2,10 @@
 Portfolio manager implementation for storage and management of portfolio data.
 """
 import logging
+from operator import attrgetter
+import numpy as np
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Union, Any
 import re
@@ -11,6 +13,40 @@ from app.core.interfaces.storage_provider import StorageProvider
 from app.core.interfaces.data_provider import DataProvider
 from app.core.domain.portfolio import Portfolio
 from app.core.domain.asset import Asset
+from app.utils.file_utils import FILENAME_TRANSLATION
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+# "TICKER:weight", "TICKER weight" or "TICKER" on a single line
+TICKER_WEIGHT_RE = re.compile(r'^(?P<ticker>[A-Za-z0-9.-]+)(?:(?::|\s+)(?P<weight>[0-9.]+))?$')
+
+# Optional CSV columns copied onto imported assets, with the type each value is converted to
+CSV_OPTIONAL_FIELDS = {
+    'name': str,
+    'weight': float,
+    'quantity': float,
+    'purchase_price': float,
+    'purchase_date': str,
+    'sector': str,
+    'industry': str,
+    'asset_class': str,
+    'region': str,
+    'currency': str
+}
+
+# Asset attributes written by export_to_csv, in Asset.to_dict order
+ASSET_EXPORT_FIELDS = (
+    'ticker', 'name', 'weight', 'current_price', 'purchase_price', 'quantity', 'sector', 'industry',
+    'asset_class', 'currency', 'country', 'exchange', 'purchase_date', 'last_updated'
+)
+
+# Text columns with few distinct values, read as dictionary-encoded/categorical columns
+CSV_CATEGORY_FIELDS = ('sector', 'industry', 'asset_class', 'region', 'currency')
 
 
 class PortfolioManagerService:
@@ -33,6 +69,10 @@ class PortfolioManagerService:
         """
         self.data_provider = data_provider
         self.storage_provider = storage_provider
+
+        # Storage base directory, resolved on first use
+        self._base_dir: Optional[Path] = None
+
         logging.info("Initialized PortfolioManagerService")
 
     def save_portfolio(self, portfolio: Portfolio) -> str:
@@ -50,12 +90,9 @@ class PortfolioManagerService:
         # Add last update timestamp
         portfolio_dict['last_updated'] = datetime.now().isoformat()
 
-        # Generate filename from portfolio ID
-        filename = f"{portfolio.id}.json"
-
         try:
             # Save to storage
-            self.storage_provider.save_json(portfolio_dict, filename)
+            self.storage_provider.save_portfolio(portfolio_dict, str(portfolio.id))
             logging.info(f"Portfolio '{portfolio.name}' saved with ID {portfolio.id}")
             return portfolio.id
         except Exception as e:
@@ -72,11 +109,9 @@ class PortfolioManagerService:
         Returns:
             Loaded portfolio as dictionary or None if not found
         """
-        filename = f"{portfolio_id}.json"
-
         try:
             # Load from storage as dictionary
-            portfolio_dict = self.storage_provider.load_json(filename)
+            portfolio_dict = self.storage_provider.load_portfolio(portfolio_id)
 
             if not portfolio_dict:
                 logging.error(f"Portfolio data is empty for ID: {portfolio_id}")
@@ -122,28 +157,18 @@ class PortfolioManagerService:
             List of dictionaries with portfolio metadata
         """
         try:
-            # Get all portfolio files
-            portfolio_files = self.storage_provider.list_files('.json')
-
-            portfolios = []
-            for file_path in portfolio_files:
-                try:
-                    # Load basic portfolio data
-                    portfolio_dict = self.storage_provider.load_json(file_path.name)
-
-                    # Extract metadata
-                    portfolio_info = {
-                        'id': portfolio_dict.get('id', file_path.stem),
-                        'name': portfolio_dict.get('name', file_path.stem),
-                        'last_updated': portfolio_dict.get('last_updated', 'Unknown'),
-                        'asset_count': len(portfolio_dict.get('assets', [])),
-                        'description': portfolio_dict.get('description', ''),
-                        'tags': portfolio_dict.get('tags', [])
-                    }
-
-                    portfolios.append(portfolio_info)
-                except Exception as e:
-                    logging.warning(f"Failed to read portfolio data from {file_path}: {e}")
+            # The storage provider keeps listing metadata indexed, so no portfolio is parsed here
+            portfolios = [
+                {
+                    'id': info.get('id'),
+                    'name': info.get('name') or info.get('id'),
+                    'last_updated': info.get('last_updated') or 'Unknown',
+                    'asset_count': info.get('asset_count', 0),
+                    'description': info.get('description', ''),
+                    'tags': info.get('tags', [])
+                }
+                for info in self.storage_provider.list_portfolios()
+            ]
 
             # Sort by name
             return sorted(portfolios, key=lambda x: x['name'])
@@ -161,11 +186,9 @@ class PortfolioManagerService:
         Returns:
             True if deletion was successful, False otherwise
         """
-        filename = f"{portfolio_id}.json"
-
         try:
             # Delete from storage
-            success = self.storage_provider.delete_file(filename)
+            success = self.storage_provider.delete_portfolio(portfolio_id)
             if success:
                 logging.info(f"Portfolio with ID {portfolio_id} deleted")
             else:
@@ -187,7 +210,8 @@ class PortfolioManagerService:
             Imported portfolio
         """
         try:
-            df = pd.read_csv(file_path)
+            path = Path(file_path)
+            df = self._read_csv(file_path)
 
             # Check required columns
             required_columns = ['ticker']
@@ -197,53 +221,51 @@ class PortfolioManagerService:
 
             # Prepare portfolio name
             if portfolio_name is None:
-                file_name = Path(file_path).stem
-                portfolio_name = file_name
+                portfolio_name = path.stem
 
             # Create portfolio
             portfolio = Portfolio(
                 id=None,  # ID will be generated
                 name=portfolio_name,
-                description=f"Imported from {Path(file_path).name}",
+                description=f"Imported from {path.name}",
                 created_at=datetime.now(),
             )
 
-            # Add assets
-            for _, row in df.iterrows():
-                asset = Asset(ticker=row['ticker'])
+            # Extract each column once as a raw array instead of materializing a Series per row
+            tickers = df['ticker'].to_numpy()
+            optional_columns = [
+                (field, field_type, df[field].to_numpy(), df[field].notna().to_numpy())
+                for field, field_type in CSV_OPTIONAL_FIELDS.items()
+                if field in df.columns
+            ]
 
+            # Add assets
+            for i, ticker in enumerate(tickers):
                 # Add optional fields
-                optional_fields = {
-                    'name': str,
-                    'weight': float,
-                    'quantity': float,
-                    'purchase_price': float,
-                    'purchase_date': str,
-                    'sector': str,
-                    'industry': str,
-                    'asset_class': str,
-                    'region': str,
-                    'currency': str
-                }
-
-                for field, field_type in optional_fields.items():
-                    if field in df.columns and not pd.isna(row[field]):
-                        setattr(asset, field, field_type(row[field]))
+                asset = Asset.from_row(ticker, **{
+                    field: field_type(values[i])
+                    for field, field_type, values, present in optional_columns
+                    if present[i]
+                })
 
                 # Add asset to portfolio
                 weight = getattr(asset, 'weight', None)
                 portfolio.add_asset(asset, weight)
 
             # If all assets have quantity but not weight, calculate weights
-            if all(hasattr(asset, 'quantity') for asset in portfolio.assets) and \
-                    not all(hasattr(asset, 'weight') for asset in portfolio.assets):
-                self._calculate_weights_from_quantities(portfolio)
+            # (checked on the CSV columns, since Asset always defines both attributes)
+            price_data = None
+            if 'quantity' in df.columns and df['quantity'].notna().all() and \
+                    not ('weight' in df.columns and df['weight'].notna().all()):
+                # Fetch prices once and reuse them when updating prices below
+                price_data = self._get_latest_price_data([asset.ticker for asset in portfolio.assets])
+                self._calculate_weights_from_quantities(portfolio, price_data)
 
             # Normalize weights
             portfolio.normalize_weights()
 
             # Enrich with additional data
-            self._enrich_portfolio_data(portfolio)
+            self._enrich_portfolio_data(portfolio, price_data)
 
             logging.info(f"Portfolio '{portfolio_name}' imported from {file_path}")
             return portfolio
@@ -265,18 +287,40 @@ class PortfolioManagerService:
         if file_path is None:
             # Generate filename from portfolio name
             safe_name = self._sanitize_filename(portfolio.name)
-            file_path = Path(self.storage_provider.get_base_dir()) / f"{safe_name}.csv"
+            file_path = self._get_base_dir() / f"{safe_name}.csv"
 
         try:
-            # Create DataFrame from assets
-            assets_data = []
-
-            for asset in portfolio.assets:
-                asset_dict = asset.to_dict()
-                assets_data.append(asset_dict)
+            # Read a fixed set of attributes per asset straight into columns, without a dict per asset
+            rows = list(map(attrgetter(*ASSET_EXPORT_FIELDS), portfolio.assets))
+            columns = dict(zip(ASSET_EXPORT_FIELDS, map(list, zip(*rows))))
+
+            # Format dates and drop optional columns without any value, as Asset.to_dict does
+            for field in ('purchase_date', 'last_updated'):
+                if field in columns:
+                    columns[field] = [value.isoformat() if isinstance(value, datetime) else value
+                                      for value in columns[field]]
+            columns = {
+                field: values for field, values in columns.items()
+                if field in ('ticker', 'name', 'weight') or any(value is not None for value in values)
+            }
+
+            # Write with the Arrow CSV writer when available
+            if pacsv is not None and rows:
+                try:
+                    table = pa.Table.from_pydict(columns)
+                    pacsv.write_csv(
+                        table,
+                        str(file_path),
+                        write_options=pacsv.WriteOptions(include_header=True)
+                    )
+
+                    logging.info(f"Portfolio '{portfolio.name}' exported to {file_path}")
+                    return str(file_path)
+                except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                    logging.warning(f"Falling back to pandas CSV writer for portfolio '{portfolio.name}': {e}")
 
             # Create DataFrame and save
-            df = pd.DataFrame(assets_data)
+            df = pd.DataFrame(columns)
             df.to_csv(file_path, index=False)
 
             logging.info(f"Portfolio '{portfolio.name}' exported to {file_path}")
@@ -294,45 +338,31 @@ class PortfolioManagerService:
 
         Returns:
             List of dictionaries with asset data
-        """
-        assets = []
 
+        Raises:
+            ValueError: If a line has a weight that is not a valid number
+        """
         text = text.strip()
 
         # Split by commas or newlines
-        lines = [line.strip() for line in text.replace(',', '\n').split('\n')]
+        lines = pd.Series(text.replace(',', '\n').split('\n'), dtype=object).str.strip()
+        lines = lines[lines != '']
 
-        for line in lines:
-            if not line:
-                continue
+        # Match all lines at once; lines that don't match come back as NaN tickers
+        matches = lines.str.extract(TICKER_WEIGHT_RE).dropna(subset=['ticker'])
 
-            # Pattern 1: TICKER:weight
-            colon_match = re.match(r'^([A-Za-z0-9.-]+):([0-9.]+)$', line)
+        # A missing weight is normalized later
+        tickers = matches['ticker'].str.upper().tolist()
+        weights = pd.to_numeric(matches['weight'], errors='coerce')
 
-            # Pattern 2: TICKER weight
-            space_match = re.match(r'^([A-Za-z0-9.-]+)\s+([0-9.]+)$', line)
+        # A weight that matched the pattern but isn't a number (e.g. "1.2.3") is an input error
+        malformed = weights.isna() & matches['weight'].notna()
+        if malformed.any():
+            raise ValueError(f"Invalid weight in lines: {lines[malformed[malformed].index].tolist()}")
 
-            # Pattern 3: TICKER only
-            ticker_only_match = re.match(r'^([A-Za-z0-9.-]+)$', line)
+        weights = weights.fillna(0.0).tolist()
 
-            if colon_match:
-                ticker, weight = colon_match.groups()
-                assets.append({
-                    'ticker': ticker.strip().upper(),
-                    'weight': float(weight.strip())
-                })
-            elif space_match:
-                ticker, weight = space_match.groups()
-                assets.append({
-                    'ticker': ticker.strip().upper(),
-                    'weight': float(weight.strip())
-                })
-            elif ticker_only_match:
-                ticker = ticker_only_match.group(1)
-                assets.append({
-                    'ticker': ticker.strip().upper(),
-                    'weight': 0.0  # Will be normalized later
-                })
+        assets = [{'ticker': ticker, 'weight': weight} for ticker, weight in zip(tickers, weights)]
 
         # If all weights are 0, distribute equally
         if assets and all(asset['weight'] == 0.0 for asset in assets):
@@ -395,12 +425,17 @@ class PortfolioManagerService:
         logging.info(f"Portfolio '{portfolio_name}' created with {len(portfolio.assets)} assets")
         return portfolio
 
-    def update_portfolio_prices(self, portfolio: Portfolio) -> Portfolio:
+    def update_portfolio_prices(
+            self,
+            portfolio: Portfolio,
+            price_data: Optional[Dict[str, pd.DataFrame]] = None
+    ) -> Portfolio:
         """
         Update current prices of assets in the portfolio
 
         Args:
             portfolio: Portfolio to update
+            price_data: Already fetched price data by ticker (if None, latest prices are fetched)
 
         Returns:
             Updated portfolio
@@ -408,32 +443,22 @@ class PortfolioManagerService:
         if not portfolio.assets:
             return portfolio
 
-        # Get tickers
-        tickers = [asset.ticker for asset in portfolio.assets]
-
         # Get latest prices
-        end_date = datetime.now().strftime('%Y-%m-%d')
-        start_date = (datetime.now() - pd.Timedelta(days=5)).strftime('%Y-%m-%d')
+        if price_data is None:
+            price_data = self._get_latest_price_data([asset.ticker for asset in portfolio.assets])
 
-        price_data = self.data_provider.get_batch_data(tickers, start_date, end_date)
+        latest_prices = self._latest_prices(price_data)
 
         # Update asset prices
         for asset in portfolio.assets:
-            ticker = asset.ticker
+            latest = latest_prices.get(asset.ticker)
 
-            if ticker in price_data and not price_data[ticker].empty:
-                latest_data = price_data[ticker].iloc[-1]
-
-                if 'Adj Close' in latest_data:
-                    current_price = latest_data['Adj Close']
-                elif 'Close' in latest_data:
-                    current_price = latest_data['Close']
-                else:
-                    continue
+            if latest is not None:
+                current_price, price_date = latest
 
                 # Update asset attributes
                 asset.current_price = current_price
-                asset.price_date = price_data[ticker].index[-1].strftime('%Y-%m-%d')
+                asset.price_date = price_date.date().isoformat()
 
                 if hasattr(asset, 'purchase_price') and asset.purchase_price:
                     asset.price_change_pct = ((current_price / float(asset.purchase_price)) - 1) * 100
@@ -441,57 +466,106 @@ class PortfolioManagerService:
         logging.info(f"Asset prices for portfolio '{portfolio.name}' have been updated")
         return portfolio
 
-    def _calculate_weights_from_quantities(self, portfolio: Portfolio) -> None:
+    @staticmethod
+    def _latest_prices(price_data: Dict[str, pd.DataFrame]) -> Dict[str, Tuple[float, pd.Timestamp]]:
         """
-        Calculate weights based on quantities and current prices
+        Extract the latest price and its date for each ticker
 
         Args:
-            portfolio: Portfolio to calculate weights for
+            price_data: Price data by ticker
+
+        Returns:
+            Dictionary {ticker: (price, date)}, using 'Adj Close' when present and 'Close' otherwise
         """
-        # Get tickers
-        tickers = [asset.ticker for asset in portfolio.assets
-                   if hasattr(asset, 'quantity') and asset.quantity]
+        latest_prices = {}
+        for ticker, df in price_data.items():
+            if df.empty:
+                continue
+            if 'Adj Close' in df.columns:
+                latest_prices[ticker] = (df['Adj Close'].to_numpy()[-1], df.index[-1])
+            elif 'Close' in df.columns:
+                latest_prices[ticker] = (df['Close'].to_numpy()[-1], df.index[-1])
 
-        # Get latest prices
-        price_data = self.data_provider.get_batch_data(tickers)
+        return latest_prices
 
-        # Calculate total value
-        total_value = 0.0
-        position_values = {}
+    def _get_latest_price_data(self, tickers: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch recent price data covering the latest close of each ticker
 
-        for asset in portfolio.assets:
-            if hasattr(asset, 'quantity') and asset.quantity and asset.ticker in price_data:
-                df = price_data[asset.ticker]
+        Args:
+            tickers: List of tickers
 
-                if not df.empty:
-                    if 'Adj Close' in df.columns:
-                        price = df['Adj Close'].iloc[-1]
-                    elif 'Close' in df.columns:
-                        price = df['Close'].iloc[-1]
-                    else:
-                        continue
+        Returns:
+            Dictionary {ticker: DataFrame} with the last few days of prices
+        """
+        today = datetime.now().date()
+        end_date = today.isoformat()
+        start_date = (today - timedelta(days=5)).isoformat()
 
-                    position_value = float(asset.quantity) * price
-                    position_values[asset.ticker] = position_value
-                    total_value += position_value
+        return self.data_provider.get_batch_data(tickers, start_date, end_date)
+
+    def _calculate_weights_from_quantities(
+            self,
+            portfolio: Portfolio,
+            price_data: Optional[Dict[str, pd.DataFrame]] = None
+    ) -> None:
+        """
+        Calculate weights based on quantities and current prices
+
+        Args:
+            portfolio: Portfolio to calculate weights for
+            price_data: Already fetched price data by ticker (if None, latest prices are fetched)
+        """
+        # Get latest prices
+        if price_data is None:
+            tickers = [asset.ticker for asset in portfolio.assets
+                       if hasattr(asset, 'quantity') and asset.quantity]
+            price_data = self._get_latest_price_data(tickers)
+
+        # Latest price per ticker, read straight from the underlying arrays
+        latest_prices = self._latest_prices(price_data)
+
+        # Position values of all priced assets with a quantity, computed at once
+        priced_assets = [asset for asset in portfolio.assets
+                         if getattr(asset, 'quantity', None) and asset.ticker in latest_prices]
+        if not priced_assets:
+            return
+
+        quantities = np.fromiter((asset.quantity for asset in priced_assets), dtype=np.float64,
+                                 count=len(priced_assets))
+        prices = np.fromiter((latest_prices[asset.ticker][0] for asset in priced_assets), dtype=np.float64,
+                             count=len(priced_assets))
+        position_values = quantities * prices
+        total_value = position_values.sum()
 
         # Set weights
         if total_value > 0:
-            for asset in portfolio.assets:
-                if asset.ticker in position_values:
-                    asset.weight = position_values[asset.ticker] / total_value
+            for asset, weight in zip(priced_assets, (position_values / total_value).tolist()):
+                asset.weight = weight
 
-    def _enrich_portfolio_data(self, portfolio: Portfolio) -> None:
+    def _enrich_portfolio_data(
+            self,
+            portfolio: Portfolio,
+            price_data: Optional[Dict[str, pd.DataFrame]] = None
+    ) -> None:
         """
         Enrich portfolio data with additional information
 
         Args:
             portfolio: Portfolio to enrich
+            price_data: Already fetched price data by ticker, reused for the price update
         """
+        # Fetch company info for all assets in one batch instead of one round trip per asset
+        try:
+            infos = self.data_provider.get_company_info_batch([asset.ticker for asset in portfolio.assets])
+        except Exception as e:
+            logging.warning(f"Unable to retrieve company information for portfolio '{portfolio.name}': {e}")
+            infos = {}
+
         for asset in portfolio.assets:
             try:
                 # Get company info
-                info = self.data_provider.get_company_info(asset.ticker)
+                info = infos.get(asset.ticker)
 
                 if info:
                     # Set asset attributes
@@ -506,7 +580,47 @@ class PortfolioManagerService:
                 logging.warning(f"Unable to retrieve information for {asset.ticker}: {e}")
 
         # Update prices
-        self.update_portfolio_prices(portfolio)
+        self.update_portfolio_prices(portfolio, price_data)
+
+    def _read_csv(self, file_path: str) -> pd.DataFrame:
+        """
+        Read a portfolio CSV file, using the multithreaded Arrow reader when available
+
+        Args:
+            file_path: Path to CSV file
+
+        Returns:
+            DataFrame with the file contents
+        """
+        if pacsv is None:
+            dtypes = {field: str for field in ('ticker', 'name', 'purchase_date')}
+            dtypes.update({field: 'category' for field in CSV_CATEGORY_FIELDS})
+            return pd.read_csv(file_path, dtype=dtypes)
+
+        # Pin column types so numeric-looking tickers and ISO dates stay strings, and read
+        # empty cells as missing values, matching pd.read_csv
+        column_types = {field: pa.string() for field in ('ticker', 'name', 'purchase_date')}
+        column_types.update({field: pa.dictionary(pa.int32(), pa.string()) for field in CSV_CATEGORY_FIELDS})
+        column_types.update({field: pa.float64() for field in ('weight', 'quantity', 'purchase_price')})
+
+        table = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=1 << 20),
+            convert_options=pacsv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+        )
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    def _get_base_dir(self) -> Path:
+        """
+        Get the storage base directory, cached after the first call
+
+        Returns:
+            Base directory path
+        """
+        if self._base_dir is None:
+            self._base_dir = Path(self.storage_provider.get_base_dir())
+
+        return self._base_dir
 
     def _sanitize_filename(self, filename: str) -> str:
         """
@@ -518,16 +632,8 @@ class PortfolioManagerService:
         Returns:
             Sanitized filename
         """
-        import re
-
-        # Replace invalid characters
-        filename = re.sub(r'[\\/*?:"<>|%\\\\\s]', '_', filename)
-
-        # Replace & with 'and'
-        filename = filename.replace('&', 'and')
-
-        # Replace other invalid characters
-        filename = filename.replace('\\', '_').replace('/', '_').replace(':', '_')
+        # Replace & with 'and' and invalid characters with '_' in one pass
+        filename = filename.replace('&', 'and').translate(FILENAME_TRANSLATION)
 
         # Limit length
         if len(filename) > 200:
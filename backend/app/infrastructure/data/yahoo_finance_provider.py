@@ -4,20 +4,81 @@ This module provides market data using the Yahoo Finance API via the yfinance pa
 """
 import os
 import logging
+from functools import lru_cache
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Set
+from collections import OrderedDict
 from datetime import datetime, timedelta
 import re
 import time
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 
 from app.infrastructure.data.market_data_provider import MarketDataProvider
+from app.utils.date_utils import now_timestamp_str
+
+try:
+    import pyarrow  # noqa: F401  (Parquet engine for the price cache)
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Errors from a multi-ticker download that can be caused by a single symbol's data, so retrying
+# the batch in halves can isolate it. Anything else (network failures, rate limiting, bad arguments)
+# would fail the same way for every part of the batch.
+BATCH_SPLIT_ERRORS = (KeyError, IndexError, ValueError)
+
+# Column types of CSV cache files, so the reader skips type inference
+# (Volume stays float so gaps in the data can be read as NaN)
+CSV_CACHE_DTYPES = {
+    'Open': 'float64',
+    'High': 'float64',
+    'Low': 'float64',
+    'Close': 'float64',
+    'Adj Close': 'float64',
+    'Volume': 'float64'
+}
+
+# Yahoo share class symbols such as "BRK-B": base symbol and single-character class
+SHARE_CLASS_RE = re.compile(r'^([^-]*)-([^-])$')
+
+# Asset type names for lowercased Yahoo quoteType values (others are capitalized as-is)
+QUOTE_TYPE_NAMES = {
+    'equity': 'Stock',
+    'stock': 'Stock',
+    'etf': 'ETF',
+    'index': 'Index',
+    'cryptocurrency': 'Cryptocurrency',
+    'crypto': 'Cryptocurrency',
+    'mutualfund': 'Mutual Fund',
+    'currency': 'Currency'
+}
+
+# Ticker separators replaced with '_' in cache file names
+CACHE_NAME_TRANSLATION = str.maketrans('.-', '__')
+
+
+@lru_cache(maxsize=4096)
+def _format_ticker(ticker: str) -> str:
+    """
+    Format ticker symbol for Yahoo Finance API, cached per symbol.
+
+    Args:
+        ticker: Original ticker symbol
+
+    Returns:
+        Formatted ticker symbol
+    """
+    # Yahoo Finance uses - instead of . in ticker symbols
+    return ticker.replace('.', '-')
+
 
 class YahooFinanceProvider(MarketDataProvider):
     """
@@ -25,6 +86,16 @@ class YahooFinanceProvider(MarketDataProvider):
     Uses the yfinance package to fetch data from the Yahoo Finance API.
     """
 
+    # Cache directories already created in this process
+    _ENSURED_DIRS: Set[str] = set()
+
+    # Seconds a ticker's info payload is reused, and the number of tickers kept
+    INFO_CACHE_TTL = 3600
+    INFO_CACHE_SIZE = 1024
+
+    # Seconds a ticker rejected by is_valid_ticker is remembered as invalid
+    INVALID_TICKER_TTL = 600
+
     def __init__(self, cache_dir: Optional[str] = None, cache_expiry_days: int = 1):
         """
         Initialize the Yahoo Finance data provider.
@@ -34,12 +105,34 @@ class YahooFinanceProvider(MarketDataProvider):
             cache_expiry_days: Number of days before cache expires
         """
         self.cache_dir = cache_dir
-        if cache_dir:
+        if cache_dir and cache_dir not in self._ENSURED_DIRS:
             os.makedirs(cache_dir, exist_ok=True)
+            self._ENSURED_DIRS.add(cache_dir)
 
         self.cache_expiry_days = cache_expiry_days
-        self.request_delay = 0.2  # Delay between API requests to avoid rate limits
-        self.last_request_time = 0
+
+        # Token bucket for API requests: bursts of up to rate_limit_capacity requests go out
+        # immediately, sustained load is throttled to rate_limit_rate requests per second
+        self.rate_limit_capacity = 5
+        self.rate_limit_rate = 5.0
+        self._bucket = {'tokens': float(self.rate_limit_capacity), 'last_refill': time.monotonic()}
+        self._bucket_lock = threading.Lock()
+
+        # Raw ticker info by formatted ticker: (fetch time, info), in LRU order
+        self._info_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+
+        # Formatted tickers known to be valid (seen with price data) and recently rejected ones
+        self._valid_tickers: Set[str] = set()
+        self._invalid_tickers: Dict[str, float] = {}
+
+        # Shared HTTP session so repeated searches reuse pooled connections
+        self._http = requests.Session()
+        self._http.headers.update({'User-Agent': 'Mozilla/5.0'})
+        self._http.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        ))
 
         # Try importing yfinance
         try:
@@ -61,8 +154,7 @@ class YahooFinanceProvider(MarketDataProvider):
         Returns:
             Formatted ticker symbol
         """
-        # Yahoo Finance uses - instead of . in ticker symbols
-        return ticker.replace('.', '-')
+        return _format_ticker(ticker)
 
     def _get_cache_path(self, ticker: str, start_date: str, end_date: str, interval: str) -> str:
         """
@@ -80,8 +172,9 @@ class YahooFinanceProvider(MarketDataProvider):
         if not self.cache_dir:
             return None
 
-        ticker = ticker.upper().replace('-', '_').replace('.', '_')
-        filename = f"{ticker}_{start_date}_{end_date}_{interval}.csv"
+        ticker = ticker.upper().translate(CACHE_NAME_TRANSLATION)
+        extension = 'parquet' if _HAS_PYARROW else 'csv'
+        filename = f"{ticker}_{start_date}_{end_date}_{interval}.{extension}"
         return os.path.join(self.cache_dir, filename)
 
     def _is_cache_valid(self, cache_path: str) -> bool:
@@ -94,13 +187,17 @@ class YahooFinanceProvider(MarketDataProvider):
         Returns:
             True if cache is valid, False otherwise
         """
-        if not cache_path or not os.path.exists(cache_path):
+        if not cache_path:
+            return False
+
+        # One stat call both checks existence and gets the modification time
+        try:
+            cache_stat = os.stat(cache_path)
+        except OSError:
             return False
 
         # Check if cache is expired
-        cache_time = datetime.fromtimestamp(os.path.getmtime(cache_path))
-        expiry_time = cache_time + timedelta(days=self.cache_expiry_days)
-        return datetime.now() < expiry_time
+        return time.time() - cache_stat.st_mtime < self.cache_expiry_days * 86400
 
     def _save_to_cache(self, df: pd.DataFrame, cache_path: str) -> None:
         """
@@ -114,7 +211,10 @@ class YahooFinanceProvider(MarketDataProvider):
             return
 
         try:
-            df.to_csv(cache_path)
+            if cache_path.endswith('.parquet'):
+                df.to_parquet(cache_path, engine='pyarrow', compression='zstd')
+            else:
+                df.to_csv(cache_path)
         except Exception as e:
             logger.warning(f"Failed to save data to cache: {e}")
 
@@ -129,26 +229,85 @@ class YahooFinanceProvider(MarketDataProvider):
             DataFrame with cached data or None if cache is invalid
         """
         if not self._is_cache_valid(cache_path):
+            return self._migrate_csv_cache(cache_path)
+
+        try:
+            if cache_path.endswith('.parquet'):
+                return pd.read_parquet(cache_path, engine='pyarrow')
+
+            return self._read_csv_cache(cache_path)
+        except Exception as e:
+            logger.warning(f"Failed to load data from cache: {e}")
+            return None
+
+    def _read_csv_cache(self, cache_path: str) -> pd.DataFrame:
+        """
+        Read a CSV cache file with the C parser over a memory-mapped file.
+
+        Args:
+            cache_path: Path to CSV cache file
+
+        Returns:
+            DataFrame with cached data
+        """
+        return pd.read_csv(
+            cache_path,
+            index_col=0,
+            parse_dates=True,
+            dtype=CSV_CACHE_DTYPES,
+            engine='c',
+            memory_map=True
+        )
+
+    def _migrate_csv_cache(self, cache_path: str) -> Optional[pd.DataFrame]:
+        """
+        Load a legacy CSV cache entry and rewrite it as Parquet.
+
+        Args:
+            cache_path: Path to the Parquet cache file
+
+        Returns:
+            DataFrame with cached data or None if there is no valid CSV entry
+        """
+        if not cache_path or not cache_path.endswith('.parquet'):
+            return None
+
+        csv_path = cache_path[:-len('.parquet')] + '.csv'
+        if not self._is_cache_valid(csv_path):
             return None
 
         try:
-            df = pd.read_csv(cache_path, index_col=0, parse_dates=True)
+            df = self._read_csv_cache(csv_path)
+            csv_stat = os.stat(csv_path)
+
+            self._save_to_cache(df, cache_path)
+            if os.path.exists(cache_path):
+                # Keep the original timestamps so the entry expires when the CSV would have
+                os.utime(cache_path, ns=(csv_stat.st_atime_ns, csv_stat.st_mtime_ns))
+                os.remove(csv_path)
+
             return df
         except Exception as e:
-            logger.warning(f"Failed to load data from cache: {e}")
+            logger.warning(f"Failed to migrate CSV cache {csv_path}: {e}")
             return None
 
     def _rate_limit_request(self) -> None:
         """
-        Implement rate limiting for API requests.
-        """
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
+        Implement rate limiting for API requests using a thread-safe token bucket.
 
-        if elapsed < self.request_delay:
-            time.sleep(self.request_delay - elapsed)
+        Takes a token if one is available, otherwise reserves the next one and sleeps
+        until it has been refilled. The sleep happens outside the lock, so concurrent
+        callers wait in parallel while the overall rate still holds.
+        """
+        with self._bucket_lock:
+            now = time.monotonic()
+            refill = (now - self._bucket['last_refill']) * self.rate_limit_rate
+            tokens = min(self.rate_limit_capacity, self._bucket['tokens'] + refill) - 1
+            self._bucket['tokens'] = tokens
+            self._bucket['last_refill'] = now
 
-        self.last_request_time = time.time()
+        if tokens < 0:
+            time.sleep(-tokens / self.rate_limit_rate)
 
     def get_historical_prices(
             self,
@@ -209,13 +368,13 @@ class YahooFinanceProvider(MarketDataProvider):
                     start=start_date,
                     end=end_date,
                     interval=interval,
-                    progress=False,
-                    show_errors=False
+                    progress=False
                 )
 
             # Save to cache
             if not data.empty:
                 self._save_to_cache(data, cache_path)
+                self._valid_tickers.add(formatted_ticker)
 
             return data
 
@@ -256,8 +415,8 @@ class YahooFinanceProvider(MarketDataProvider):
             if data.empty:
                 return {}
 
-            # Get the last row
-            latest_data = data.iloc[-1].to_dict()
+            # Get the last row straight from the column arrays, without building a row Series
+            latest_data = {column: float(data[column].to_numpy()[-1]) for column in data.columns}
 
             # Add timestamp
             latest_data['timestamp'] = data.index[-1].strftime('%Y-%m-%d %H:%M:%S')
@@ -285,11 +444,7 @@ class YahooFinanceProvider(MarketDataProvider):
         formatted_ticker = self._format_ticker(ticker)
 
         try:
-            # Implement rate limiting
-            self._rate_limit_request()
-
-            ticker_obj = self.yf.Ticker(formatted_ticker)
-            info = ticker_obj.info
+            info = self._get_ticker_info(formatted_ticker)
 
             # Normalize and format the data
             normalized_info = {
@@ -309,7 +464,7 @@ class YahooFinanceProvider(MarketDataProvider):
                 'website': info.get('website', 'N/A'),
                 'logo_url': info.get('logo_url'),
                 'asset_type': self._determine_asset_type(info),
-                'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                'last_updated': now_timestamp_str()
             }
 
             return normalized_info
@@ -353,13 +508,16 @@ class YahooFinanceProvider(MarketDataProvider):
 
         result = {}
 
-        # Format tickers
-        formatted_tickers = [self._format_ticker(ticker) for ticker in tickers]
-        ticker_mapping = {self._format_ticker(ticker): ticker for ticker in tickers}
-
-        # Check which tickers we need to fetch (not in cache)
+        # Format each ticker once and check which ones we need to fetch (not in cache)
+        ticker_mapping = {}
+        cache_paths = {}
         tickers_to_fetch = []
-        for formatted_ticker, original_ticker in ticker_mapping.items():
+        for original_ticker in tickers:
+            formatted_ticker = self._format_ticker(original_ticker)
+            if formatted_ticker in ticker_mapping:
+                continue
+            ticker_mapping[formatted_ticker] = original_ticker
+
             cache_path = self._get_cache_path(original_ticker, start_date, end_date, interval)
             cached_data = self._load_from_cache(cache_path)
 
@@ -367,61 +525,103 @@ class YahooFinanceProvider(MarketDataProvider):
                 logger.info(f"Loaded {original_ticker} data from cache")
                 result[original_ticker] = cached_data
             else:
+                cache_paths[formatted_ticker] = cache_path
                 tickers_to_fetch.append(formatted_ticker)
 
         if not tickers_to_fetch:
             return result
 
+        try:
+            downloaded = self._download_batch(tickers_to_fetch, start_date, end_date, interval)
+
+            for formatted_ticker, ticker_data in downloaded.items():
+                self._save_to_cache(ticker_data, cache_paths[formatted_ticker])
+                self._valid_tickers.add(formatted_ticker)
+                result[ticker_mapping[formatted_ticker]] = ticker_data
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Error retrieving batch prices: {e}")
+            return result
+
+    def _download_batch(
+            self,
+            formatted_tickers: List[str],
+            start_date: str,
+            end_date: str,
+            interval: str
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Download prices for several tickers with one multi-ticker request.
+
+        If the request fails with one of BATCH_SPLIT_ERRORS, the batch is split in halves which
+        are retried the same way, so a single bad symbol only costs a few extra requests. A single
+        ticker that still fails falls back to get_historical_prices. Other errors are raised;
+        once part of a split batch is downloaded, a later error is logged and the part is kept.
+
+        Args:
+            formatted_tickers: Ticker symbols already formatted for Yahoo Finance
+            start_date: Start date (format: YYYY-MM-DD)
+            end_date: End date (format: YYYY-MM-DD)
+            interval: Data interval
+
+        Returns:
+            Dictionary mapping formatted tickers to non-empty price DataFrames
+
+        Raises:
+            Exception: If the download fails with an error that splitting the batch can't avoid
+        """
         try:
             # Implement rate limiting
             self._rate_limit_request()
 
             # Use yfinance to get data for multiple tickers
             data = self.yf.download(
-                tickers_to_fetch,
+                formatted_tickers,
                 start=start_date,
                 end=end_date,
                 interval=interval,
                 group_by='ticker',
-                progress=False,
-                show_errors=False
+                progress=False
             )
-
-            # Process the data
-            if len(tickers_to_fetch) == 1:
-                # When only one ticker is fetched, the data doesn't have multi-level columns
-                formatted_ticker = tickers_to_fetch[0]
-                original_ticker = ticker_mapping[formatted_ticker]
-
-                if not data.empty:
-                    cache_path = self._get_cache_path(original_ticker, start_date, end_date, interval)
-                    self._save_to_cache(data, cache_path)
-                    result[original_ticker] = data
-            else:
-                # Process multi-ticker data
-                for formatted_ticker in tickers_to_fetch:
-                    if formatted_ticker in data.columns.levels[0]:
-                        original_ticker = ticker_mapping[formatted_ticker]
-                        ticker_data = data[formatted_ticker].copy()
-
-                        if not ticker_data.empty:
-                            cache_path = self._get_cache_path(original_ticker, start_date, end_date, interval)
-                            self._save_to_cache(ticker_data, cache_path)
-                            result[original_ticker] = ticker_data
-
-            return result
-
         except Exception as e:
-            logger.error(f"Error retrieving batch prices: {e}")
+            # requests' JSON decode error is also a ValueError, but it means Yahoo sent no usable response
+            if not isinstance(e, BATCH_SPLIT_ERRORS) or isinstance(e, requests.RequestException):
+                raise
+
+            if len(formatted_tickers) == 1:
+                logger.debug(f"Batch download failed for {formatted_tickers[0]}, fetching it individually: {e}")
+                data = self.get_historical_prices(formatted_tickers[0], start_date, end_date, interval)
+                return {formatted_tickers[0]: data} if not data.empty else {}
+
+            middle = len(formatted_tickers) // 2
+            logger.debug(f"Batch download of {len(formatted_tickers)} tickers failed, retrying in halves: {e}")
+            downloaded = self._download_batch(formatted_tickers[:middle], start_date, end_date, interval)
+            try:
+                downloaded.update(self._download_batch(formatted_tickers[middle:], start_date, end_date, interval))
+            except Exception as second_error:
+                logger.error(f"Error retrieving batch prices for {len(formatted_tickers) - middle} tickers: {second_error}")
+            return downloaded
+
+        # Process the data
+        downloaded = {}
+        if len(formatted_tickers) == 1:
+            # When only one ticker is fetched, the data doesn't have multi-level columns
+            if not data.empty:
+                downloaded[formatted_tickers[0]] = data
+        else:
+            # Process multi-ticker data (tickers actually present in the columns, looked up once)
+            present = set(data.columns.get_level_values(0))
+            for formatted_ticker in formatted_tickers:
+                if formatted_ticker in present:
+                    # No eager copy: the cache writer only reads the frame
+                    ticker_data = data.xs(formatted_ticker, axis=1, level=0, drop_level=True)
 
-            # If batch request fails, fall back to individual requests
-            for ticker in tickers:
-                if ticker not in result:
-                    data = self.get_historical_prices(ticker, start_date, end_date, interval)
-                    if not data.empty:
-                        result[ticker] = data
+                    if not ticker_data.empty:
+                        downloaded[formatted_ticker] = ticker_data
 
-            return result
+        return downloaded
 
     def search_tickers(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -441,12 +641,11 @@ class YahooFinanceProvider(MarketDataProvider):
             # Yahoo Finance has no official search API in yfinance
             # We'll use a direct request to their search endpoint
             url = f"https://query2.finance.yahoo.com/v1/finance/search?q={query}&quotesCount={limit}&newsCount=0"
-            headers = {'User-Agent': 'Mozilla/5.0'}
 
             # Implement rate limiting
             self._rate_limit_request()
 
-            response = requests.get(url, headers=headers)
+            response = self._http.get(url, timeout=5)
             if response.status_code != 200:
                 logger.error(f"Error searching tickers: {response.status_code}")
                 return []
@@ -458,13 +657,10 @@ class YahooFinanceProvider(MarketDataProvider):
                 for quote in data['quotes'][:limit]:
                     # Convert ticker format if needed (- to .)
                     symbol = quote.get('symbol', '')
-                    display_symbol = symbol
 
-                    if '-' in symbol:
-                        parts = symbol.split('-')
-                        if len(parts) == 2 and len(parts[1]) == 1:
-                            # Special case for .A, .B shares
-                            display_symbol = f"{parts[0]}.{parts[1]}"
+                    # Special case for .A, .B shares
+                    share_class = SHARE_CLASS_RE.match(symbol)
+                    display_symbol = f"{share_class[1]}.{share_class[2]}" if share_class else symbol
 
                     result = {
                         'symbol': display_symbol,
@@ -500,27 +696,49 @@ class YahooFinanceProvider(MarketDataProvider):
         }
 
         results = {
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'timestamp': now_timestamp_str(),
             'markets': {}
         }
 
-        for region, index_symbol in indices.items():
-            try:
-                latest_price = self.get_latest_price(index_symbol)
-
-                if latest_price:
-                    day_change = 0
-                    if 'Close' in latest_price and 'Open' in latest_price and latest_price['Open'] > 0:
-                        day_change = (latest_price['Close'] - latest_price['Open']) / latest_price['Open'] * 100
-
-                    results['markets'][region] = {
-                        'index': index_symbol,
-                        'price': latest_price.get('Close'),
-                        'change_pct': day_change,
-                        'status': 'open' if abs(day_change) > 0.001 else 'closed'
-                    }
-            except Exception as e:
-                logger.warning(f"Error getting market status for {region}: {e}")
+        try:
+            # Fetch the last 2 days of all indices in one batch request
+            end_date = datetime.now()
+            start_date = end_date - timedelta(days=2)
+            price_data = self.get_batch_prices(
+                list(indices.values()),
+                start_date=start_date.strftime('%Y-%m-%d'),
+                end_date=end_date.strftime('%Y-%m-%d')
+            )
+        except Exception as e:
+            logger.warning(f"Error getting market status: {e}")
+            return results
+
+        regions = [region for region, index_symbol in indices.items()
+                   if index_symbol in price_data and not price_data[index_symbol].empty]
+        if not regions:
+            return results
+
+        def last_values(column: str) -> np.ndarray:
+            return np.array([
+                price_data[indices[region]][column].to_numpy()[-1]
+                if column in price_data[indices[region]].columns else np.nan
+                for region in regions
+            ], dtype=np.float64)
+
+        # Day change of all indices at once; 0 when Open/Close is missing or Open is not positive
+        opens = last_values('Open')
+        closes = last_values('Close')
+        valid = (opens > 0) & ~np.isnan(closes)
+        day_changes = np.zeros(len(regions))
+        np.divide((closes - opens) * 100, opens, out=day_changes, where=valid)
+
+        for region, close, day_change in zip(regions, closes.tolist(), day_changes.tolist()):
+            results['markets'][region] = {
+                'index': indices[region],
+                'price': None if np.isnan(close) else close,
+                'change_pct': day_change,
+                'status': 'open' if abs(day_change) > 0.001 else 'closed'
+            }
 
         return results
 
@@ -583,20 +801,68 @@ class YahooFinanceProvider(MarketDataProvider):
 
         formatted_ticker = self._format_ticker(ticker)
 
-        try:
-            # Implement rate limiting
-            self._rate_limit_request()
+        # Answer from the known valid/invalid tickers without a network request
+        if formatted_ticker in self._valid_tickers:
+            return True
 
-            ticker_obj = self.yf.Ticker(formatted_ticker)
-            info = ticker_obj.info
+        now = time.monotonic()
+        rejected_at = self._invalid_tickers.get(formatted_ticker)
+        if rejected_at is not None and now - rejected_at < self.INVALID_TICKER_TTL:
+            return False
+
+        try:
+            info = self._get_ticker_info(formatted_ticker)
 
             # Check if we got valid info
-            return bool(info and len(info) > 5 and 'regularMarketPrice' in info)
+            is_valid = bool(info and len(info) > 5 and 'regularMarketPrice' in info)
+
+            if is_valid:
+                self._valid_tickers.add(formatted_ticker)
+                self._invalid_tickers.pop(formatted_ticker, None)
+            else:
+                self._invalid_tickers[formatted_ticker] = now
+
+                # Drop expired rejections once the map grows large
+                if len(self._invalid_tickers) > self.INFO_CACHE_SIZE:
+                    self._invalid_tickers = {
+                        key: rejected_at for key, rejected_at in self._invalid_tickers.items()
+                        if now - rejected_at < self.INVALID_TICKER_TTL
+                    }
+
+            return is_valid
 
         except Exception as e:
             logger.debug(f"Error validating ticker {ticker}: {e}")
             return False
 
+    def _get_ticker_info(self, formatted_ticker: str) -> Dict[str, Any]:
+        """
+        Get the raw Yahoo Finance info payload for a ticker, reusing recent responses.
+
+        Args:
+            formatted_ticker: Ticker symbol formatted for Yahoo Finance
+
+        Returns:
+            Info dictionary
+        """
+        now = time.monotonic()
+        cached = self._info_cache.get(formatted_ticker)
+        if cached is not None and now - cached[0] < self.INFO_CACHE_TTL:
+            self._info_cache.move_to_end(formatted_ticker)
+            return cached[1]
+
+        # Implement rate limiting
+        self._rate_limit_request()
+
+        info = self.yf.Ticker(formatted_ticker).info
+
+        self._info_cache[formatted_ticker] = (now, info)
+        self._info_cache.move_to_end(formatted_ticker)
+        while len(self._info_cache) > self.INFO_CACHE_SIZE:
+            self._info_cache.popitem(last=False)
+
+        return info
+
     def _determine_asset_type(self, info: Dict[str, Any]) -> str:
         """
         Determine the asset type based on ticker info.
@@ -612,20 +878,7 @@ class YahooFinanceProvider(MarketDataProvider):
 
         if 'quoteType' in info:
             quote_type = info['quoteType'].lower()
-            if quote_type in ['equity', 'stock']:
-                return 'Stock'
-            elif quote_type == 'etf':
-                return 'ETF'
-            elif quote_type == 'index':
-                return 'Index'
-            elif quote_type in ['cryptocurrency', 'crypto']:
-                return 'Cryptocurrency'
-            elif quote_type == 'mutualfund':
-                return 'Mutual Fund'
-            elif quote_type == 'currency':
-                return 'Currency'
-            else:
-                return quote_type.capitalize()
+            return QUOTE_TYPE_NAMES.get(quote_type, quote_type.capitalize())
 
         # Try to determine type from other fields
         if 'fundFamily' in info and info['fundFamily']:
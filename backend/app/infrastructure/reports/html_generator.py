@@ -8,6 +8,27 @@ from pathlib import Path
 import json
 
 from app.infrastructure.reports.template_engine import TemplateEngine
+from app.utils.date_utils import now_timestamp_str
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _to_json(value: Any) -> str:
+    """
+    Serialize a value for embedding in templates, using orjson when it is installed
+
+    Args:
+        value: Value to serialize
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
 
 
 class HTMLGenerator:
@@ -139,15 +160,14 @@ class HTMLGenerator:
 
         # Add JSON utilities for interactive features
         context.update({
-            "to_json": lambda x: json.dumps(x)
+            "to_json": _to_json
         })
 
         return context
 
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return now_timestamp_str()
 
     def _prepare_chart_data(
             self,
@@ -162,24 +182,32 @@ class HTMLGenerator:
             analytics_data: Analytics data
 
         Returns:
-            Chart data for templates
+            Chart data for templates; line charts take their categories from charts._shared.dates
         """
         charts = {}
 
-        # Portfolio allocation chart
-        assets = portfolio_data.get("assets", [])
+        # Portfolio allocation chart (weights and labels collected in one pass)
+        weights, labels = [], []
+        for asset in portfolio_data.get("assets", []):
+            weights.append(asset.get("weight", 0))
+            labels.append(asset.get("ticker", ""))
+
         charts["allocation"] = {
             "type": "pie",
-            "data": [asset.get("weight", 0) for asset in assets],
-            "labels": [asset.get("ticker", "") for asset in assets]
+            "data": weights,
+            "labels": labels
         }
 
+        # Dates shared by the time series charts, embedded once instead of per chart; the leading
+        # underscore keeps the key from colliding with a chart name
+        if "dates" in analytics_data and ("returns" in analytics_data or "drawdowns" in analytics_data):
+            charts["_shared"] = {"dates": analytics_data.get("dates", [])}
+
         # Performance chart
         if "returns" in analytics_data and "dates" in analytics_data:
             charts["performance"] = {
                 "type": "line",
                 "data": analytics_data.get("cumulative_returns", {}),
-                "categories": analytics_data.get("dates", []),
                 "title": "Cumulative Performance"
             }
 
@@ -188,7 +216,6 @@ class HTMLGenerator:
             charts["drawdowns"] = {
                 "type": "line",
                 "data": analytics_data.get("drawdowns", {}),
-                "categories": analytics_data.get("dates", []),
                 "title": "Drawdowns"
             }
 
@@ -1,13 +1,163 @@
 """
 PDF report generator implementation.
 """
+import atexit
+import hashlib
+import io
+import json
 import logging
+import multiprocessing
 import os
-from typing import Dict, Any, Optional, List
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
-import base64
 
-from app.infrastructure.reports.template_engine import TemplateEngine
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+except ImportError:
+    Figure = None
+    FigureCanvasAgg = None
+
+from app.infrastructure.reports.template_engine import TemplateEngine, load_weasyprint
+from app.utils.date_utils import now_timestamp_str
+
+# Start method for chart worker processes. Forking a process that runs web-server threads can
+# copy locks held by other threads into the child, so workers start from a clean interpreter
+CHART_WORKER_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# MIME types for the supported chart image formats
+CHART_MIME_TYPES = {
+    "svg": "image/svg+xml",
+    "png": "image/png",
+    "jpeg": "image/jpeg"
+}
+
+# Maximum number of encoded charts kept per generator
+CHART_CACHE_SIZE = 256
+
+# One reusable figure/canvas pair per thread, so chart encoding never touches pyplot's global state
+_chart_figures = threading.local()
+
+
+def _get_chart_figure() -> Tuple[Any, Any]:
+    """
+    Get the current thread's chart figure and canvas, creating them on first use
+
+    Returns:
+        Tuple of (figure, canvas)
+    """
+    figure = getattr(_chart_figures, "figure", None)
+    if figure is None:
+        figure = Figure(figsize=(10, 6))
+        _chart_figures.figure = figure
+        _chart_figures.canvas = FigureCanvasAgg(figure)
+    return figure, _chart_figures.canvas
+
+
+def _chart_cache_key(chart_data: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Hash chart data into a cache key
+
+    Args:
+        chart_data: Chart data
+
+    Returns:
+        16-byte digest, or None if the data can't be serialized
+    """
+    try:
+        if orjson is not None:
+            raw = orjson.dumps(chart_data, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            raw = json.dumps(chart_data, sort_keys=True).encode('utf-8')
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def _render_chart(chart_data: Dict[str, Any]) -> str:
+    """
+    Render chart data to a base64 data URI.
+    Module-level so it can run in chart worker processes.
+
+    Args:
+        chart_data: Chart data; the optional "format" key selects
+            "svg" (default), "png" or "jpeg" output
+
+    Returns:
+        Base64 encoded chart image
+    """
+    try:
+        fig, canvas = _get_chart_figure()
+        fig.clear()
+        ax = fig.add_subplot(111)
+
+        # Plot data based on chart type
+        chart_type = chart_data.get("type", "line")
+
+        if chart_type == "line":
+            for series in chart_data.get("series", []):
+                ax.plot(
+                    series.get("x", []),
+                    series.get("y", []),
+                    label=series.get("name", "")
+                )
+            ax.legend()
+
+        elif chart_type == "bar":
+            x = chart_data.get("categories", [])
+            for series in chart_data.get("series", []):
+                ax.bar(
+                    x,
+                    series.get("data", []),
+                    label=series.get("name", "")
+                )
+            ax.legend()
+
+        elif chart_type == "pie":
+            ax.pie(
+                chart_data.get("data", []),
+                labels=chart_data.get("labels", []),
+                autopct='%1.1f%%'
+            )
+
+        # Set title and labels
+        ax.set_title(chart_data.get("title", ""))
+        ax.set_xlabel(chart_data.get("xAxis", {}).get("title", ""))
+        ax.set_ylabel(chart_data.get("yAxis", {}).get("title", ""))
+
+        # Render to buffer; SVG is embedded by WeasyPrint as vector graphics without rasterizing,
+        # JPEG gives the smallest raster payload for opaque charts
+        chart_format = chart_data.get("format", "svg")
+        buf = io.BytesIO()
+        if chart_format == "jpeg":
+            canvas.print_jpg(buf, pil_kwargs={"quality": 85, "optimize": False})
+        elif chart_format == "png":
+            canvas.print_png(buf)
+        else:
+            chart_format = "svg"
+            canvas.print_figure(buf, format='svg')
+
+        # Encode as base64
+        chart_base64 = base64.b64encode(buf.getbuffer()).decode('ascii')
+
+        return f"data:{CHART_MIME_TYPES[chart_format]};base64,{chart_base64}"
+    except Exception as e:
+        logging.error(f"Error encoding chart: {e}")
+        return ""
 
 
 class PDFGenerator:
@@ -16,6 +166,10 @@ class PDFGenerator:
     Generates PDF reports from templates and data.
     """
 
+    # Worker processes for rendering several charts in parallel, shared by all generators
+    _chart_executor: Optional[ProcessPoolExecutor] = None
+    _chart_executor_lock = threading.Lock()
+
     def __init__(self, template_dir: str = "./templates/pdf"):
         """
         Initialize PDF generator
@@ -25,6 +179,10 @@ class PDFGenerator:
         """
         self.template_dir = Path(template_dir)
         self.template_engine = TemplateEngine(template_dir)
+
+        # Encoded charts by content hash, least recently used first
+        self._chart_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._chart_cache_lock = threading.Lock()
         logging.info(f"Initialized PDFGenerator with template directory: {self.template_dir}")
 
     def generate_report(
@@ -32,7 +190,8 @@ class PDFGenerator:
             template_name: str,
             data: Dict[str, Any],
             output_path: str,
-            options: Optional[Dict[str, Any]] = None
+            options: Optional[Dict[str, Any]] = None,
+            timestamp: Optional[str] = None
     ) -> str:
         """
         Generate PDF report
@@ -42,13 +201,14 @@ class PDFGenerator:
             data: Report data
             output_path: Path to save the output
             options: Additional options for PDF generation
+            timestamp: Report generation time already taken by the caller; defaults to now
 
         Returns:
             Path to the generated PDF
         """
         try:
             # Prepare context with data
-            context = self._prepare_context(data, options)
+            context = self._prepare_context(data, options, timestamp)
 
             # Render PDF using template engine
             pdf_path = self.template_engine.render_pdf(
@@ -63,6 +223,39 @@ class PDFGenerator:
             logging.error(f"Error generating PDF report: {e}")
             raise
 
+    def generate_reports_batch(self, requests: List[Dict[str, Any]]) -> List[str]:
+        """
+        Generate several PDF reports sharing one WeasyPrint font configuration
+
+        Args:
+            requests: Report requests, each with "template_name", "data",
+                "output_path" and optional "options" keys
+
+        Returns:
+            Paths to the generated PDFs, in request order
+        """
+        try:
+            _, FontConfiguration = load_weasyprint()
+
+            # System fonts are scanned once for the whole batch
+            font_config = FontConfiguration()
+
+            pdf_paths = []
+            for request in requests:
+                context = self._prepare_context(request["data"], request.get("options"))
+                pdf_paths.append(self.template_engine.render_pdf(
+                    request["template_name"],
+                    context,
+                    request["output_path"],
+                    font_config=font_config
+                ))
+
+            logging.info(f"Generated {len(pdf_paths)} PDF reports")
+            return pdf_paths
+        except Exception as e:
+            logging.error(f"Error generating PDF reports batch: {e}")
+            raise
+
     def generate_portfolio_report(
             self,
             portfolio_data: Dict[str, Any],
@@ -85,6 +278,9 @@ class PDFGenerator:
             Path to the generated report
         """
         try:
+            # One generation time for the whole report
+            timestamp = self._get_timestamp()
+
             # Combine data
             data = {
                 "portfolio": portfolio_data,
@@ -93,11 +289,11 @@ class PDFGenerator:
                     "summary", "performance", "risk", "allocation", "details"
                 ],
                 "report_type": "portfolio",
-                "timestamp": self._get_timestamp()
+                "timestamp": timestamp
             }
 
             # Generate report
-            return self.generate_report(template_name, data, output_path)
+            return self.generate_report(template_name, data, output_path, timestamp=timestamp)
         except Exception as e:
             logging.error(f"Error generating portfolio report: {e}")
             raise
@@ -105,7 +301,8 @@ class PDFGenerator:
     def _prepare_context(
             self,
             data: Dict[str, Any],
-            options: Optional[Dict[str, Any]] = None
+            options: Optional[Dict[str, Any]] = None,
+            timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Prepare template context
@@ -113,6 +310,8 @@ class PDFGenerator:
         Args:
             data: Report data
             options: Additional options
+            timestamp: Report generation time; defaults to now. A "timestamp" key in
+                data or options is always replaced.
 
         Returns:
             Template context
@@ -125,7 +324,7 @@ class PDFGenerator:
 
         # Add standard context
         context.update({
-            "timestamp": self._get_timestamp(),
+            "timestamp": timestamp or self._get_timestamp(),
             "generator": "Investment Portfolio Management System",
             "version": "1.0.0"
         })
@@ -135,76 +334,136 @@ class PDFGenerator:
             "encode_chart": self._encode_chart
         })
 
+        # Pre-render report charts
+        charts = context.get("charts")
+        if isinstance(charts, list) and charts:
+            context["encoded_charts"] = self._encode_charts(charts)
+
         return context
 
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return now_timestamp_str()
 
     def _encode_chart(self, chart_data: Dict[str, Any]) -> str:
         """
         Encode chart data as base64 for embedding in PDF
 
         Args:
-            chart_data: Chart data
+            chart_data: Chart data; the optional "format" key selects
+                "svg" (default), "png" or "jpeg" output
 
         Returns:
             Base64 encoded chart image
         """
-        try:
-            import io
-            import matplotlib.pyplot as plt
-
-            # Create figure
-            fig = plt.figure(figsize=(10, 6))
-
-            # Plot data based on chart type
-            chart_type = chart_data.get("type", "line")
-
-            if chart_type == "line":
-                for series in chart_data.get("series", []):
-                    plt.plot(
-                        series.get("x", []),
-                        series.get("y", []),
-                        label=series.get("name", "")
-                    )
-                plt.legend()
-
-            elif chart_type == "bar":
-                x = chart_data.get("categories", [])
-                for series in chart_data.get("series", []):
-                    plt.bar(
-                        x,
-                        series.get("data", []),
-                        label=series.get("name", "")
-                    )
-                plt.legend()
-
-            elif chart_type == "pie":
-                plt.pie(
-                    chart_data.get("data", []),
-                    labels=chart_data.get("labels", []),
-                    autopct='%1.1f%%'
-                )
+        key = _chart_cache_key(chart_data)
+        cached = self._get_cached_chart(key)
+        if cached is not None:
+            return cached
 
-            # Set title and labels
-            plt.title(chart_data.get("title", ""))
-            plt.xlabel(chart_data.get("xAxis", {}).get("title", ""))
-            plt.ylabel(chart_data.get("yAxis", {}).get("title", ""))
+        encoded = _render_chart(chart_data)
+        self._cache_chart(key, encoded)
+        return encoded
+
+    def _encode_charts(self, charts: List[Dict[str, Any]]) -> List[str]:
+        """
+        Encode several charts, rendering them in worker processes when there is more than one
 
-            # Save to buffer
-            buf = io.BytesIO()
-            plt.savefig(buf, format='png')
-            buf.seek(0)
+        Args:
+            charts: List of chart data
 
-            # Encode as base64
-            chart_base64 = base64.b64encode(buf.read()).decode('utf-8')
+        Returns:
+            Base64 encoded chart images, in input order
+        """
+        keys = [_chart_cache_key(chart) for chart in charts]
+        encoded = [self._get_cached_chart(key) for key in keys]
+        missing = [i for i, value in enumerate(encoded) if value is None]
 
-            # Close figure
-            plt.close(fig)
+        if len(missing) <= 1:
+            return [value if value is not None else self._encode_chart(chart)
+                    for value, chart in zip(encoded, charts)]
 
-            return f"data:image/png;base64,{chart_base64}"
+        try:
+            rendered = list(self._get_chart_executor().map(_render_chart, [charts[i] for i in missing]))
+        except BrokenProcessPool as e:
+            # A worker died; start a fresh pool on the next call
+            self.shutdown_chart_executor()
+            logging.warning(f"Chart worker pool failed, rendering serially: {e}")
+            rendered = [_render_chart(charts[i]) for i in missing]
         except Exception as e:
-            logging.error(f"Error encoding chart: {e}")
-            return ""
\ No newline at end of file
+            logging.warning(f"Parallel chart rendering failed, rendering serially: {e}")
+            rendered = [_render_chart(charts[i]) for i in missing]
+
+        for i, value in zip(missing, rendered):
+            encoded[i] = value
+            self._cache_chart(keys[i], value)
+
+        return encoded
+
+    def _get_cached_chart(self, key: Optional[bytes]) -> Optional[str]:
+        """
+        Look up an encoded chart by cache key
+
+        Args:
+            key: Chart cache key
+
+        Returns:
+            Encoded chart, or None if not cached
+        """
+        if key is None:
+            return None
+
+        with self._chart_cache_lock:
+            encoded = self._chart_cache.get(key)
+            if encoded is not None:
+                self._chart_cache.move_to_end(key)
+            return encoded
+
+    def _cache_chart(self, key: Optional[bytes], encoded: str) -> None:
+        """
+        Store an encoded chart, evicting the least recently used entry when full
+
+        Args:
+            key: Chart cache key
+            encoded: Encoded chart
+        """
+        # Failed renders are not cached
+        if key is None or not encoded:
+            return
+
+        with self._chart_cache_lock:
+            self._chart_cache[key] = encoded
+            self._chart_cache.move_to_end(key)
+            if len(self._chart_cache) > CHART_CACHE_SIZE:
+                self._chart_cache.popitem(last=False)
+
+    @classmethod
+    def _get_chart_executor(cls) -> ProcessPoolExecutor:
+        """
+        Get the shared chart worker pool, starting it on first use
+
+        Returns:
+            Process pool executor
+        """
+        with cls._chart_executor_lock:
+            if cls._chart_executor is None:
+                cls._chart_executor = ProcessPoolExecutor(
+                    max_workers=min(8, os.cpu_count() or 1),
+                    mp_context=multiprocessing.get_context(CHART_WORKER_START_METHOD)
+                )
+            return cls._chart_executor
+
+    @classmethod
+    def shutdown_chart_executor(cls) -> None:
+        """
+        Stop the shared chart worker pool, if it is running.
+        Registered to run at interpreter exit; a later render starts a new pool.
+        """
+        with cls._chart_executor_lock:
+            executor, cls._chart_executor = cls._chart_executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(PDFGenerator.shutdown_chart_executor)
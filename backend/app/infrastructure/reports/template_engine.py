@@ -1,11 +1,83 @@
 """
 Report template engine implementation.
 """
+import json
 import logging
 import os
-from typing import Dict, Any, Optional
+import re
+from functools import lru_cache
+from typing import Dict, Any, Optional, Mapping, Tuple
 from pathlib import Path
 import jinja2
+import pandas as pd
+
+from app.utils.file_utils import json_serializer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
+
+@lru_cache(maxsize=None)
+def load_weasyprint() -> Tuple[Any, Any]:
+    """
+    Import WeasyPrint once per process.
+    It is heavy and needs system libraries, so it is only loaded when a PDF is rendered.
+
+    Returns:
+        Tuple of (HTML, FontConfiguration) classes
+    """
+    from weasyprint import HTML
+    from weasyprint.text.fonts import FontConfiguration
+    return HTML, FontConfiguration
+
+
+# Screen-only stylesheets and rules that WeasyPrint would otherwise fetch and parse for print output
+SCREEN_BUNDLE_LINK_RE = re.compile(r'<link[^>]+href="[^"]*\.bundle[^"]*"[^>]*>', re.IGNORECASE)
+SCREEN_MEDIA_BLOCK_RE = re.compile(r'@media\s+screen[^{]*\{(?:[^{}]*\{[^{}]*\})*[^{}]*\}', re.IGNORECASE)
+
+
+# Bound str.format methods for the decimal places templates commonly use
+_NUMBER_FORMATS = {decimals: f"{{:,.{decimals}f}}".format for decimals in range(7)}
+_PERCENT_FORMATS = {decimals: f"{{:.{decimals}f}}%".format for decimals in range(7)}
+
+
+def format_currency(value, symbol='$', decimals=2):
+    """Format value as currency"""
+    if value is None:
+        return ""
+    number_format = _NUMBER_FORMATS.get(decimals)
+    if number_format is None:
+        return f"{symbol}{value:,.{decimals}f}"
+    return symbol + number_format(value)
+
+
+def format_percentage(value, decimals=2):
+    """Format value as percentage"""
+    if value is None:
+        return ""
+    percent_format = _PERCENT_FORMATS.get(decimals)
+    if percent_format is None:
+        return f"{value * 100:.{decimals}f}%"
+    return percent_format(value * 100)
+
+
+def format_number(value, decimals=2):
+    """Format value as number"""
+    if value is None:
+        return ""
+    number_format = _NUMBER_FORMATS.get(decimals)
+    if number_format is None:
+        return f"{value:,.{decimals}f}"
+    return number_format(value)
 
 
 class TemplateEngine:
@@ -14,23 +86,34 @@ class TemplateEngine:
     Handles rendering templates for report generation.
     """
 
-    def __init__(self, template_dir: str = "./templates"):
+    def __init__(self, template_dir: str = "./templates", bytecode_cache_dir: Optional[str] = None):
         """
         Initialize template engine
 
         Args:
             template_dir: Directory containing templates
+            bytecode_cache_dir: Directory for compiled template bytecode
+                (defaults to a per-user directory under the system temp dir)
         """
         self.template_dir = Path(template_dir)
         self.env = jinja2.Environment(
             loader=jinja2.FileSystemLoader(self.template_dir),
-            autoescape=jinja2.select_autoescape(['html', 'xml'])
+            autoescape=jinja2.select_autoescape(['html', 'xml']),
+            auto_reload=False,
+            cache_size=400,
+            # Compiled templates survive process restarts, so only the first render after a deploy compiles
+            bytecode_cache=jinja2.FileSystemBytecodeCache(bytecode_cache_dir)
         )
 
+        # Compiled templates by name; auto_reload is off, so the loader isn't re-checked per render
+        self._get_template = lru_cache(maxsize=64)(self.env.get_template)
+
         # Add custom filters
-        self.env.filters['format_currency'] = self._format_currency
-        self.env.filters['format_percentage'] = self._format_percentage
-        self.env.filters['format_number'] = self._format_number
+        self.env.filters.update({
+            'format_currency': format_currency,
+            'format_percentage': format_percentage,
+            'format_number': format_number
+        })
 
         logging.info(f"Initialized TemplateEngine with template directory: {self.template_dir}")
 
@@ -38,7 +121,8 @@ class TemplateEngine:
             self,
             template_name: str,
             context: Dict[str, Any],
-            output_path: str
+            output_path: str,
+            font_config: Optional[Any] = None
     ) -> str:
         """
         Render PDF report
@@ -47,6 +131,7 @@ class TemplateEngine:
             template_name: Template name
             context: Template context data
             output_path: Path to save the output
+            font_config: Optional shared WeasyPrint FontConfiguration
 
         Returns:
             Path to the rendered PDF
@@ -55,13 +140,17 @@ class TemplateEngine:
             # First render HTML
             html_content = self.render_html_string(template_name, context)
 
-            # Convert HTML to PDF
-            from weasyprint import HTML
-            pdf = HTML(string=html_content).write_pdf()
-
-            # Save to file
-            with open(output_path, 'wb') as f:
-                f.write(pdf)
+            # Convert HTML to PDF written straight to the output file;
+            # local stylesheets resolve against the template directory
+            HTML, _ = load_weasyprint()
+            HTML(
+                string=self._strip_pdf_irrelevant_css(html_content),
+                base_url=str(self.template_dir)
+            ).write_pdf(
+                target=output_path,
+                presentational_hints=False,
+                font_config=font_config
+            )
 
             logging.info(f"Rendered PDF report to {output_path}")
             return output_path
@@ -69,10 +158,24 @@ class TemplateEngine:
             logging.error(f"Error rendering PDF: {e}")
             raise
 
+    @staticmethod
+    def _strip_pdf_irrelevant_css(html: str) -> str:
+        """
+        Remove screen-only CSS bundles and @media screen blocks before PDF rendering
+
+        Args:
+            html: Rendered HTML content
+
+        Returns:
+            HTML content without screen-only styles
+        """
+        html = SCREEN_BUNDLE_LINK_RE.sub('', html)
+        return SCREEN_MEDIA_BLOCK_RE.sub('', html)
+
     def render_html(
             self,
             template_name: str,
-            context: Dict[str, Any],
+            context: Mapping[str, Any],
             output_path: str
     ) -> str:
         """
@@ -87,12 +190,11 @@ class TemplateEngine:
             Path to the rendered HTML
         """
         try:
-            # Render HTML
-            html_content = self.render_html_string(template_name, context)
-
-            # Save to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # Stream rendered chunks to the file instead of building the whole document in memory
+            template = self._get_template(f"{template_name}.html")
+            stream = template.stream(context)
+            stream.enable_buffering(size=64)
+            stream.dump(str(output_path), encoding='utf-8')
 
             logging.info(f"Rendered HTML report to {output_path}")
             return output_path
@@ -103,7 +205,7 @@ class TemplateEngine:
     def render_html_string(
             self,
             template_name: str,
-            context: Dict[str, Any]
+            context: Mapping[str, Any]
     ) -> str:
         """
         Render HTML template to string
@@ -116,8 +218,8 @@ class TemplateEngine:
             Rendered HTML string
         """
         try:
-            template = self.env.get_template(f"{template_name}.html")
-            html_content = template.render(**context)
+            template = self._get_template(f"{template_name}.html")
+            html_content = template.render(context)
             return html_content
         except Exception as e:
             logging.error(f"Error rendering HTML template: {e}")
@@ -139,8 +241,6 @@ class TemplateEngine:
             Path to the saved Excel file
         """
         try:
-            import pandas as pd
-
             # Convert data to DataFrame
             sheets = {}
             for sheet_name, sheet_data in data.items():
@@ -151,8 +251,8 @@ class TemplateEngine:
                 else:
                     sheets[sheet_name] = pd.DataFrame([sheet_data])
 
-            # Create Excel writer
-            with pd.ExcelWriter(output_path) as writer:
+            # Create Excel writer; XlsxWriter writes the workbook in a single pass
+            with pd.ExcelWriter(output_path, engine='xlsxwriter') as writer:
                 for sheet_name, df in sheets.items():
                     df.to_excel(writer, sheet_name=sheet_name, index=False)
 
@@ -178,14 +278,16 @@ class TemplateEngine:
             Path to the saved JSON file
         """
         try:
-            import json
-
-            # Convert to serializable format
-            from app.utils.formatters import json_serializer
-
-            # Save to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=json_serializer)
+            # Save to file, converting values with json_serializer
+            if orjson is not None:
+                Path(output_path).write_bytes(orjson.dumps(
+                    data,
+                    default=json_serializer,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, default=json_serializer)
 
             logging.info(f"Exported data to JSON: {output_path}")
             return output_path
@@ -209,8 +311,6 @@ class TemplateEngine:
             Path to the saved CSV file
         """
         try:
-            import pandas as pd
-
             # Convert to DataFrame
             if isinstance(data, list):
                 df = pd.DataFrame(data)
@@ -219,6 +319,17 @@ class TemplateEngine:
             else:
                 df = pd.DataFrame([data])
 
+            # Write with the Arrow CSV writer when available
+            if pacsv is not None:
+                try:
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                    pacsv.write_csv(table, str(output_path))
+
+                    logging.info(f"Exported data to CSV: {output_path}")
+                    return output_path
+                except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                    logging.warning(f"Falling back to pandas CSV writer for {output_path}: {e}")
+
             # Save to file
             df.to_csv(output_path, index=False)
 
@@ -227,21 +338,3 @@ class TemplateEngine:
         except Exception as e:
             logging.error(f"Error exporting to CSV: {e}")
             raise
-
-    def _format_currency(self, value, symbol='$', decimals=2):
-        """Format value as currency"""
-        if value is None:
-            return ""
-        return f"{symbol}{value:,.{decimals}f}"
-
-    def _format_percentage(self, value, decimals=2):
-        """Format value as percentage"""
-        if value is None:
-            return ""
-        return f"{value * 100:.{decimals}f}%"
-
-    def _format_number(self, value, decimals=2):
-        """Format value as number"""
-        if value is None:
-            return ""
-        return f"{value:,.{decimals}f}"
\ No newline at end of file
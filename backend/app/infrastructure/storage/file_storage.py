@@ -3,6 +3,7 @@ File storage service implementation for data persistence.
 """
 import os
 import json
+import mmap
 import pickle
 import re
 import logging
@@ -11,7 +12,24 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union, Pattern
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from app.core.interfaces.storage_provider import StorageProvider
+from app.utils.file_utils import FILENAME_TRANSLATION
+
+# Buffer size for pickle file I/O; cache payloads are typically large DataFrames
+PICKLE_BUFFER_SIZE = 1024 * 1024
+
+# Pickle files larger than this are unpickled straight from a memory map
+PICKLE_MMAP_THRESHOLD = 1024 * 1024
+
+# Files of at least this size written to these subdirectories are dropped from the page cache,
+# since large reports and cache dumps are usually written once and not read back soon
+PAGE_CACHE_EVICT_THRESHOLD = 8 * 1024 * 1024
+PAGE_CACHE_EVICT_SUBDIRS = frozenset({'cache', 'reports'})
 
 
 class FileStorageService(StorageProvider):
@@ -65,8 +83,14 @@ class FileStorageService(StorageProvider):
         file_path = self._get_full_path(filename, subdir='portfolios')
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
+            if orjson is not None:
+                file_path.write_bytes(orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
 
             logging.info(f"Saved data to JSON file: {file_path}")
             return str(file_path)
@@ -92,8 +116,12 @@ class FileStorageService(StorageProvider):
         file_path = self._get_full_path(filename, subdir='portfolios')
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if orjson is not None:
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handler below still applies
+                data = orjson.loads(file_path.read_bytes())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
 
             logging.info(f"Loaded data from JSON file: {file_path}")
             return data
@@ -126,8 +154,8 @@ class FileStorageService(StorageProvider):
         file_path = self._get_full_path(filename, subdir='cache')
 
         try:
-            with open(file_path, 'wb') as f:
-                pickle.dump(data, f)
+            with open(file_path, 'wb', buffering=PICKLE_BUFFER_SIZE) as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
 
             logging.info(f"Saved data to pickle file: {file_path}")
             return str(file_path)
@@ -153,8 +181,13 @@ class FileStorageService(StorageProvider):
         file_path = self._get_full_path(filename, subdir='cache')
 
         try:
-            with open(file_path, 'rb') as f:
-                data = pickle.load(f)
+            with open(file_path, 'rb', buffering=PICKLE_BUFFER_SIZE) as f:
+                if os.fstat(f.fileno()).st_size > PICKLE_MMAP_THRESHOLD:
+                    # Unpickle from the mapped pages instead of through the file buffer
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        data = pickle.loads(mm)
+                else:
+                    data = pickle.load(f)
 
             logging.info(f"Loaded data from pickle file: {file_path}")
             return data
@@ -186,15 +219,18 @@ class FileStorageService(StorageProvider):
         directory = self.base_dir / subdir
 
         try:
-            # Get all files with the specified extension
-            files = list(directory.glob(f"*{extension}"))
+            # Get names of all files with the specified extension
+            with os.scandir(directory) as entries:
+                names = [entry.name for entry in entries if entry.name.endswith(extension) and entry.is_file()]
 
             # Filter by pattern if provided
             if pattern:
                 pattern_compiled = re.compile(pattern)
-                files = [f for f in files if pattern_compiled.search(f.name)]
+                names = [name for name in names if pattern_compiled.search(name)]
 
-            return sorted(files)
+            # Sort names, building paths only for the result
+            names.sort()
+            return [directory / name for name in names]
         except Exception as e:
             logging.error(f"Error listing files with extension {extension} in {directory}: {e}")
             return []
@@ -243,8 +279,7 @@ class FileStorageService(StorageProvider):
         file_path = self._get_full_path(filename, subdir=subdir)
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(text)
+            self._write_bytes(file_path, text.encode('utf-8'), subdir)
 
             logging.info(f"Saved text to file: {file_path}")
             return str(file_path)
@@ -295,8 +330,7 @@ class FileStorageService(StorageProvider):
         file_path = self._get_full_path(filename, subdir=subdir)
 
         try:
-            with open(file_path, 'wb') as f:
-                f.write(data)
+            self._write_bytes(file_path, data, subdir)
 
             logging.info(f"Saved binary data to file: {file_path}")
             return str(file_path)
@@ -304,6 +338,34 @@ class FileStorageService(StorageProvider):
             logging.error(f"Error saving binary data to {file_path}: {e}")
             raise
 
+    @staticmethod
+    def _write_bytes(file_path: Path, data: bytes, subdir: str) -> None:
+        """
+        Write data to a file, dropping large one-shot files from the page cache
+
+        Args:
+            file_path: Destination path
+            data: Data to write
+            subdir: Subdirectory the file belongs to
+        """
+        if (len(data) < PAGE_CACHE_EVICT_THRESHOLD or subdir not in PAGE_CACHE_EVICT_SUBDIRS
+                or not hasattr(os, 'posix_fadvise')):
+            file_path.write_bytes(data)
+            return
+
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            with memoryview(data) as view:
+                written = 0
+                while written < len(view):
+                    written += os.write(fd, view[written:])
+
+            # No flush: on Linux this starts writeback of dirty pages without waiting for it and drops
+            # the pages already clean; the rest become reclaimable once written back
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
     def load_binary(self, filename: str, subdir: str = 'reports') -> bytes:
         """
         Load binary data from file
@@ -331,13 +393,14 @@ class FileStorageService(StorageProvider):
             logging.error(f"Error loading binary data from {file_path}: {e}")
             raise
 
-    def copy_file(self, source: str, destination: str) -> bool:
+    def copy_file(self, source: str, destination: str, preserve_metadata: bool = False) -> bool:
         """
         Copy a file
 
         Args:
             source: Source file path
-            destination: Destination file path
+            destination: Destination file or directory path
+            preserve_metadata: Whether to also copy permissions and timestamps
 
         Returns:
             True if copy was successful, False otherwise
@@ -346,7 +409,15 @@ class FileStorageService(StorageProvider):
         destination_path = Path(destination)
 
         try:
-            shutil.copy2(source_path, destination_path)
+            if destination_path.is_dir():
+                destination_path = destination_path / source_path.name
+
+            # copyfile raises SameFileError rather than truncating a file copied onto itself,
+            # and copies in the kernel (sendfile) where the platform allows
+            shutil.copyfile(source_path, destination_path)
+
+            if preserve_metadata:
+                shutil.copystat(source_path, destination_path)
 
             logging.info(f"Copied file from {source_path} to {destination_path}")
             return True
@@ -465,17 +536,5 @@ class FileStorageService(StorageProvider):
         Returns:
             Sanitized filename
         """
-        # Replace invalid characters
-        filename = re.sub(r'[\\/*?:"<>|%\\\\\s]', '_', filename)
-
-        # Replace & with 'and'
-        filename = filename.replace('&', 'and')
-
-        # Replace other invalid characters
-        filename = filename.replace('\\', '_').replace('/', '_').replace(':', '_')
-
-        # Limit length
-        if len(filename) > 200:
-            filename = filename[:197] + '...'
-
-        return filename
\ No newline at end of file
+        # Replace & with 'and', then invalid characters, and limit length
+        return filename.replace('&', 'and').translate(FILENAME_TRANSLATION)[:200]
\ No newline at end of file
@@ -2,14 +2,524 @@
 JSON storage implementation for portfolio and other data.
 """
 import os
+import asyncio
+import atexit
+import heapq
 import json
 import logging
+import mmap
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Callable, Tuple, Set
 
 from app.core.interfaces.storage_provider import StorageProvider
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import ormsgpack
+except ImportError:
+    ormsgpack = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# JSON container types, including simdjson's lazy proxies when it is installed
+_JSON_CONTAINER_TYPES = (dict, list) + ((simdjson.Object, simdjson.Array) if simdjson is not None else ())
+
+# Documents larger than this are parsed straight from a memory map instead of a bytes copy
+MMAP_READ_THRESHOLD = 128 * 1024
+
+# Stream portfolio listing metadata with ijson when simdjson is missing; only ijson's C backend
+# is faster than a full orjson parse
+STREAM_PORTFOLIO_METADATA = simdjson is None and ijson is not None and ijson.backend == 'yajl2_c'
+
+# Document file extension by storage format
+DOCUMENT_EXTENSIONS = {'json': '.json', 'msgpack': '.mpk'}
+
+# Leading bytes of a JSON document; in msgpack these are small positive integers, never a map
+_JSON_LEADING_BYTES = frozenset(b'{[ \t\r\n')
+
+# Number of loaded documents kept in memory for repeated loads
+OBJECT_CACHE_SIZE = 256
+
+# Per-subdirectory file persisting listing metadata between runs (no .json suffix, so listings skip it)
+METADATA_INDEX_FILENAME = '.metadata_index'
+
+# Bumped whenever an extractor's output changes, so indexes written by older code are rebuilt
+METADATA_INDEX_VERSION = 2
+
+# One simdjson parser per thread; a parser holds a single document at a time
+_simdjson_parsers = threading.local()
+
+# Worker threads for parallel reads and writes, shared by all storage services; file I/O and
+# orjson parsing release the GIL. Tasks run on it must not wait on other tasks on it.
+_io_pool: Optional[ThreadPoolExecutor] = None
+_io_pool_lock = threading.Lock()
+
+
+def _get_io_pool() -> ThreadPoolExecutor:
+    """
+    Get the shared I/O worker pool, starting it on first use.
+
+    Returns:
+        Thread pool executor
+    """
+    global _io_pool
+    with _io_pool_lock:
+        if _io_pool is None:
+            _io_pool = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 4) * 4),
+                thread_name_prefix='json-storage'
+            )
+        return _io_pool
+
+
+def _shutdown_io_pool() -> None:
+    """
+    Stop the shared I/O worker pool, if it is running; a later call to _get_io_pool starts a new one.
+    """
+    global _io_pool
+    with _io_pool_lock:
+        pool, _io_pool = _io_pool, None
+
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+atexit.register(_shutdown_io_pool)
+
+
+def _newest_first(items: List[Dict[str, Any]], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Order listing entries by creation date, newest first.
+
+    Args:
+        items: Listing entries
+        limit: Optional maximum number of entries to return
+
+    Returns:
+        Newest entries first, at most limit of them
+    """
+    def key(item):
+        return item.get('created_at', '')
+
+    if limit:
+        # Partial selection: O(N log k) instead of sorting everything
+        return heapq.nlargest(limit, items, key=key)
+
+    items.sort(key=key, reverse=True)
+    return items
+
+
+def _matches(values: Dict[str, Any], criteria: Tuple[Tuple[str, Any], ...]) -> bool:
+    """
+    Check whether values match every filter criterion, stopping at the first mismatch.
+
+    Args:
+        values: Values to check
+        criteria: (key, expected value) pairs
+
+    Returns:
+        True if all criteria match
+    """
+    get = values.get
+    for key, expected in criteria:
+        if get(key) != expected:
+            return False
+    return True
+
+
+# Stdlib fallback encoder, matching orjson's indented output
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def _dump_json_bytes(data: Any) -> Union[bytes, bytearray]:
+    """
+    Encode data as indented UTF-8 JSON, using orjson when it is installed
+
+    Args:
+        data: Data to encode
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+    # Encode chunk by chunk so the whole document never exists as a str as well as bytes
+    buffer = bytearray()
+    for chunk in _JSON_ENCODER.iterencode(data):
+        buffer += chunk.encode('utf-8')
+    return buffer
+
+
+def _load_json_bytes(raw: bytes) -> Any:
+    """
+    Decode a UTF-8 JSON document, using orjson when it is installed
+
+    Args:
+        raw: Encoded JSON document
+
+    Returns:
+        Decoded data
+    """
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch either
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _read_json_file(file_path: Path) -> Any:
+    """
+    Read and decode a JSON file, handing large files to orjson as a memory-mapped buffer
+
+    Args:
+        file_path: JSON file path
+
+    Returns:
+        Decoded data
+    """
+    with open(file_path, 'rb') as f:
+        if orjson is None or os.fstat(f.fileno()).st_size <= MMAP_READ_THRESHOLD:
+            return _load_json_bytes(f.read())
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _dump_msgpack_bytes(data: Any) -> bytes:
+    """
+    Encode data as msgpack
+
+    Args:
+        data: Data to encode
+
+    Returns:
+        Encoded msgpack document
+    """
+    return ormsgpack.packb(data, option=ormsgpack.OPT_SERIALIZE_NUMPY | ormsgpack.OPT_NON_STR_KEYS)
+
+
+def _is_json(raw: bytes) -> bool:
+    """
+    Tell JSON documents from msgpack ones by their first byte
+
+    Args:
+        raw: Encoded document
+
+    Returns:
+        True if the document is JSON
+    """
+    return bool(raw) and raw[0] in _JSON_LEADING_BYTES
+
+
+def _load_msgpack_bytes(raw: bytes) -> Any:
+    """
+    Decode a msgpack document
+
+    Args:
+        raw: Encoded msgpack document
+
+    Returns:
+        Decoded data
+    """
+    if ormsgpack is None:
+        raise ValueError("ormsgpack is required to read msgpack documents")
+    return ormsgpack.unpackb(raw)
+
+
+def _read_document(file_path: Path) -> Any:
+    """
+    Read and decode a stored document, whichever format it was written in
+
+    Args:
+        file_path: Document file path
+
+    Returns:
+        Decoded data
+    """
+    if file_path.suffix == DOCUMENT_EXTENSIONS['json']:
+        return _read_json_file(file_path)
+
+    raw = file_path.read_bytes()
+    return _load_json_bytes(raw) if _is_json(raw) else _load_msgpack_bytes(raw)
+
+
+def _copy_document(value: Any) -> Any:
+    """
+    Copy a decoded document's dicts and lists, sharing its immutable scalars
+
+    Args:
+        value: Decoded document or value inside it
+
+    Returns:
+        Copy that can be mutated without affecting the original
+    """
+    if isinstance(value, dict):
+        return {key: _copy_document(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_document(item) for item in value]
+    return value
+
+
+def _atomic_write(file_path: Path, payload: Union[bytes, bytearray]) -> None:
+    """
+    Write a file through a temporary sibling and os.replace, so readers never see a partial file
+
+    Args:
+        file_path: Destination path
+        payload: File contents
+    """
+    tmp_path = file_path.with_name(f"{file_path.name}.tmp.{os.getpid()}.{threading.get_ident()}")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _parse_lazy(raw: bytes) -> Any:
+    """
+    Parse a JSON document for metadata extraction.
+    With simdjson, only the values that are accessed get decoded; the returned proxies are
+    valid until the calling thread's next parse.
+
+    Args:
+        raw: Encoded JSON document
+
+    Returns:
+        Decoded (or lazily decoded) data
+    """
+    if simdjson is None:
+        return _load_json_bytes(raw)
+
+    parser = getattr(_simdjson_parsers, 'parser', None)
+    if parser is not None:
+        try:
+            return parser.parse(raw)
+        except RuntimeError:
+            # Proxies from the previous document are still referenced (e.g. by a traceback)
+            pass
+
+    parser = simdjson.Parser()
+    _simdjson_parsers.parser = parser
+    return parser.parse(raw)
+
+
+def _parse_document_lazy(raw: bytes) -> Any:
+    """
+    Parse a stored document for metadata extraction, whichever format it was written in
+
+    Args:
+        raw: Encoded document
+
+    Returns:
+        Decoded (or lazily decoded) data
+    """
+    return _parse_lazy(raw) if _is_json(raw) else _load_msgpack_bytes(raw)
+
+
+def _materialize(value: Any) -> Any:
+    """
+    Convert simdjson proxies inside extracted metadata to plain Python objects
+
+    Args:
+        value: Extracted value
+
+    Returns:
+        Value without simdjson proxies
+    """
+    if isinstance(value, dict):
+        return {key: _materialize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_materialize(item) for item in value]
+    if simdjson is not None:
+        if isinstance(value, simdjson.Object):
+            return value.as_dict()
+        if isinstance(value, simdjson.Array):
+            return value.as_list()
+    return value
+
+
+def _portfolio_metadata(data: Dict[str, Any], file_path: Path) -> Dict[str, Any]:
+    """
+    Extract portfolio listing metadata
+
+    Args:
+        data: Portfolio data
+        file_path: Portfolio file path
+
+    Returns:
+        Portfolio metadata
+    """
+    return {
+        'id': data.get('id', file_path.stem),
+        'name': data.get('name', ''),
+        'created_at': data.get('created_at', ''),
+        'last_updated': data.get('last_updated', ''),
+        'asset_count': len(data.get('assets', [])),
+        'description': data.get('description', ''),
+        'tags': data.get('tags', [])
+    }
+
+
+def _stream_portfolio_metadata(file_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Extract portfolio listing metadata by streaming the JSON file's top level.
+    Assets are counted without being decoded, and parsing stops once every needed key has been seen.
+
+    Args:
+        file_path: Portfolio JSON file path
+
+    Returns:
+        Portfolio metadata, or None if the document's shape needs a full parse
+    """
+    values = {}
+    asset_count = 0
+    assets_done = False
+    tags = None
+
+    with open(file_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == 'assets.item' or (prefix == 'assets' and event == 'map_key'):
+                # Only the first event of each item (or each key of an assets object) is counted
+                if event not in ('end_map', 'end_array', 'map_key') or prefix == 'assets':
+                    asset_count += 1
+            elif prefix == 'assets':
+                if event in ('start_map', 'start_array'):
+                    continue
+                if event not in ('end_map', 'end_array'):
+                    # len() of a scalar fails in the full extractor too
+                    return None
+                assets_done = True
+            elif prefix == 'tags.item':
+                if event in ('start_map', 'start_array'):
+                    return None
+                tags.append(value)
+            elif prefix == 'tags' and event in ('start_array', 'end_array'):
+                if event == 'start_array':
+                    tags = []
+                else:
+                    values['tags'] = tags
+            elif prefix in ('id', 'name', 'created_at', 'last_updated', 'description', 'tags'):
+                if event in ('start_map', 'start_array'):
+                    return None
+                values[prefix] = value
+            elif prefix == '':
+                if event == 'map_key' and value in values:
+                    # Duplicate key; let the full parser apply its last-one-wins rule
+                    return None
+                if event not in ('start_map', 'end_map', 'map_key'):
+                    # Not an object at the top level
+                    return None
+                continue
+            else:
+                continue
+
+            if assets_done and len(values) == 6:
+                break
+
+    return {
+        'id': values.get('id', file_path.stem),
+        'name': values.get('name', ''),
+        'created_at': values.get('created_at', ''),
+        'last_updated': values.get('last_updated', ''),
+        'asset_count': asset_count,
+        'description': values.get('description', ''),
+        'tags': values.get('tags', [])
+    }
+
+
+def _report_metadata(data: Dict[str, Any], file_path: Path) -> Dict[str, Any]:
+    """
+    Extract report listing metadata
+
+    Args:
+        data: Report data
+        file_path: Report file path
+
+    Returns:
+        Report metadata
+    """
+    return {
+        'id': data.get('id', file_path.stem),
+        'name': data.get('name', ''),
+        'portfolio_id': data.get('portfolio_id', ''),
+        'report_type': data.get('report_type', ''),
+        'created_at': data.get('created_at', ''),
+        'file_path': data.get('file_path', '')
+    }
+
+
+def _optimization_metadata(data: Dict[str, Any], file_path: Path) -> Dict[str, Any]:
+    """
+    Extract optimization result listing metadata
+
+    Args:
+        data: Optimization result data
+        file_path: Result file path
+
+    Returns:
+        Optimization result metadata
+    """
+    return {
+        'id': data.get('id', file_path.stem),
+        'portfolio_id': data.get('portfolio_id', ''),
+        'method': data.get('method', ''),
+        'created_at': data.get('created_at', '')
+    }
+
+
+def _object_metadata(data: Dict[str, Any], file_path: Path) -> Dict[str, Any]:
+    """
+    Extract generic object listing metadata, plus the top-level fields used for filtering
+
+    Args:
+        data: Object data
+        file_path: Object file path
+
+    Returns:
+        Dictionary with 'info' (listing metadata), 'fields' (top-level scalar values)
+        and 'nested' (names of top-level container values)
+    """
+    object_info = {
+        'id': data.get('id', file_path.stem),
+        'created_at': data.get('created_at', ''),
+        'last_updated': data.get('last_updated', '')
+    }
+
+    # Add common metadata fields if present
+    for field in ['name', 'description', 'type']:
+        if field in data:
+            object_info[field] = data[field]
+
+    fields = {}
+    nested = []
+    for key, value in data.items():
+        if isinstance(value, _JSON_CONTAINER_TYPES):
+            nested.append(key)
+        else:
+            fields[key] = value
+
+    return {'info': object_info, 'fields': fields, 'nested': nested}
+
 
 class JsonStorageService(StorageProvider):
     """
@@ -17,14 +527,44 @@ class JsonStorageService(StorageProvider):
     Implements the StorageProvider interface.
     """
 
-    def __init__(self, storage_dir: str):
+    def __init__(self, storage_dir: str, storage_format: str = "json"):
         """
         Initialize the JSON storage service.
 
         Args:
             storage_dir: Base directory for JSON storage
+            storage_format: Format to write documents in ("json" or "msgpack"); documents
+                in either format are always readable
         """
         self.storage_dir = Path(storage_dir)
+        self.storage_format = storage_format.lower()
+
+        if self.storage_format not in DOCUMENT_EXTENSIONS:
+            logger.warning("Unsupported storage format: %s. Using json instead.", storage_format)
+            self.storage_format = "json"
+        elif self.storage_format == "msgpack" and ormsgpack is None:
+            logger.warning("ormsgpack is not installed. Using json instead.")
+            self.storage_format = "json"
+
+        # Extension new documents are written with, and the one of documents in the other format
+        self._extension = DOCUMENT_EXTENSIONS[self.storage_format]
+        self._other_extension = next(ext for ext in DOCUMENT_EXTENSIONS.values() if ext != self._extension)
+        self._document_suffixes = tuple(DOCUMENT_EXTENSIONS.values())
+        self._dump_document = _dump_msgpack_bytes if self.storage_format == "msgpack" else _dump_json_bytes
+
+        # Listing metadata by (subdirectory, extractor name) and filename, as (st_mtime_ns, st_size, metadata);
+        # an entry is reused only while the file's mtime and size are unchanged
+        self._meta_cache: Dict[Tuple[str, str], Dict[str, Tuple[int, int, Dict[str, Any]]]] = {}
+
+        # Recently loaded documents by (subdirectory, ID), as (filename, st_mtime_ns, st_size, data),
+        # in least recently used order
+        self._object_cache: OrderedDict = OrderedDict()
+        self._object_cache_lock = threading.Lock()
+
+        # Subdirectories whose metadata index was loaded from disk, and those changed since it was written
+        self._loaded_indexes: Set[str] = set()
+        self._dirty_indexes: Set[str] = set()
+        self._index_lock = threading.Lock()
 
         # Create storage directory if it doesn't exist
         self.storage_dir.mkdir(parents=True, exist_ok=True)
@@ -32,7 +572,16 @@ class JsonStorageService(StorageProvider):
         # Create subdirectories
         self._create_subdirectories()
 
-        logging.info(f"Initialized JsonStorageService with storage directory: {self.storage_dir}")
+        # Object type to directory name, for directories known to exist
+        self._type_dir_cache: Dict[str, str] = {
+            'portfolio': 'portfolios',
+            'report': 'reports',
+            'optimization': 'optimizations',
+            'scenario': 'scenarios',
+            'template': 'templates'
+        }
+
+        logger.info("Initialized JsonStorageService with storage directory: %s", self.storage_dir)
 
     def _create_subdirectories(self) -> None:
         """Create required subdirectories."""
@@ -41,7 +590,7 @@ class JsonStorageService(StorageProvider):
         for subdir in subdirs:
             path = self.storage_dir / subdir
             path.mkdir(exist_ok=True)
-            logging.info(f"Created directory: {path}")
+            logger.debug("Created directory: %s", path)
 
     def save_json(self, data: Dict[str, Any], filename: str) -> str:
         """
@@ -65,13 +614,13 @@ class JsonStorageService(StorageProvider):
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            _atomic_write(file_path, _dump_json_bytes(data))
+            self._invalidate_metadata(file_path)
 
-            logging.info(f"Saved data to JSON file: {file_path}")
+            logger.info("Saved data to JSON file: %s", file_path)
             return str(file_path)
         except Exception as e:
-            logging.error(f"Error saving JSON data to {file_path}: {e}")
+            logger.error("Error saving JSON data to %s: %s", file_path, e)
             raise
 
     def load_json(self, filename: str) -> Dict[str, Any]:
@@ -95,20 +644,19 @@ class JsonStorageService(StorageProvider):
         file_path = self.storage_dir / 'portfolios' / filename
 
         if not file_path.exists():
-            logging.error(f"JSON file not found: {file_path}")
+            logger.error("JSON file not found: %s", file_path)
             raise FileNotFoundError(f"File {filename} not found")
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_json_file(file_path)
 
-            logging.info(f"Loaded data from JSON file: {file_path}")
+            logger.debug("Loaded data from JSON file: %s", file_path)
             return data
         except json.JSONDecodeError as e:
-            logging.error(f"Error decoding JSON from {file_path}: {e}")
+            logger.error("Error decoding JSON from %s: %s", file_path, e)
             raise
         except Exception as e:
-            logging.error(f"Error loading JSON data from {file_path}: {e}")
+            logger.error("Error loading JSON data from %s: %s", file_path, e)
             raise
 
     def save_portfolio(
@@ -126,29 +674,7 @@ class JsonStorageService(StorageProvider):
         Returns:
             Portfolio ID
         """
-        # Use provided ID or get it from data
-        if portfolio_id is None:
-            portfolio_id = portfolio_data.get('id')
-            if portfolio_id is None:
-                raise ValueError("Portfolio ID not provided and not found in data")
-
-        # Set portfolio ID in data
-        portfolio_data['id'] = portfolio_id
-
-        # Add metadata
-        if 'created_at' not in portfolio_data:
-            portfolio_data['created_at'] = datetime.now().isoformat()
-
-        portfolio_data['last_updated'] = datetime.now().isoformat()
-
-        # Save to file
-        file_path = self.storage_dir / 'portfolios' / f"{portfolio_id}.json"
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(portfolio_data, f, ensure_ascii=False, indent=2)
-
-        logging.info(f"Saved portfolio data with ID: {portfolio_id}")
-        return portfolio_id
+        return self._save('portfolios', portfolio_data, portfolio_id, 'portfolio', stamp_updated=True)
 
     def load_portfolio(self, portfolio_id: str) -> Dict[str, Any]:
         """
@@ -160,16 +686,7 @@ class JsonStorageService(StorageProvider):
         Returns:
             Dictionary with portfolio data
         """
-        file_path = self.storage_dir / 'portfolios' / f"{portfolio_id}.json"
-
-        if not file_path.exists():
-            raise FileNotFoundError(f"Portfolio with ID {portfolio_id} not found")
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            portfolio_data = json.load(f)
-
-        logging.info(f"Loaded portfolio data with ID: {portfolio_id}")
-        return portfolio_data
+        return self._load('portfolios', portfolio_id, 'portfolio')
 
     def delete_portfolio(self, portfolio_id: str) -> bool:
         """
@@ -181,19 +698,7 @@ class JsonStorageService(StorageProvider):
         Returns:
             True if deletion was successful, False otherwise
         """
-        file_path = self.storage_dir / 'portfolios' / f"{portfolio_id}.json"
-
-        if not file_path.exists():
-            logging.warning(f"Portfolio with ID {portfolio_id} not found for deletion")
-            return False
-
-        try:
-            file_path.unlink()
-            logging.info(f"Deleted portfolio with ID: {portfolio_id}")
-            return True
-        except Exception as e:
-            logging.error(f"Error deleting portfolio {portfolio_id}: {e}")
-            return False
+        return self._delete('portfolios', portfolio_id, 'portfolio')
 
     def list_portfolios(self) -> List[Dict[str, Any]]:
         """
@@ -203,27 +708,11 @@ class JsonStorageService(StorageProvider):
             List of dictionaries with portfolio metadata
         """
         portfolio_dir = self.storage_dir / 'portfolios'
-        portfolio_files = list(portfolio_dir.glob('*.json'))
 
-        portfolios = []
-        for file_path in portfolio_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                # Extract metadata
-                portfolio_info = {
-                    'id': data.get('id', file_path.stem),
-                    'name': data.get('name', ''),
-                    'created_at': data.get('created_at', ''),
-                    'last_updated': data.get('last_updated', ''),
-                    'asset_count': len(data.get('assets', [])),
-                    'description': data.get('description', '')
-                }
-
-                portfolios.append(portfolio_info)
-            except Exception as e:
-                logging.error(f"Error reading portfolio file {file_path.name}: {e}")
+        portfolios = [
+            dict(metadata)
+            for _, metadata in self._read_all_metadata(portfolio_dir, _portfolio_metadata, 'portfolio')
+        ]
 
         # Sort by name
         portfolios.sort(key=lambda x: x.get('name', ''))
@@ -245,27 +734,7 @@ class JsonStorageService(StorageProvider):
         Returns:
             Report ID
         """
-        # Use provided ID or get it from data
-        if report_id is None:
-            report_id = report_data.get('id')
-            if report_id is None:
-                raise ValueError("Report ID not provided and not found in data")
-
-        # Set report ID in data
-        report_data['id'] = report_id
-
-        # Add metadata
-        if 'created_at' not in report_data:
-            report_data['created_at'] = datetime.now().isoformat()
-
-        # Save to file
-        file_path = self.storage_dir / 'reports' / f"{report_id}.json"
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, ensure_ascii=False, indent=2)
-
-        logging.info(f"Saved report data with ID: {report_id}")
-        return report_id
+        return self._save('reports', report_data, report_id, 'report')
 
     def load_report(self, report_id: str) -> Dict[str, Any]:
         """
@@ -277,16 +746,7 @@ class JsonStorageService(StorageProvider):
         Returns:
             Dictionary with report data
         """
-        file_path = self.storage_dir / 'reports' / f"{report_id}.json"
-
-        if not file_path.exists():
-            raise FileNotFoundError(f"Report with ID {report_id} not found")
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            report_data = json.load(f)
-
-        logging.info(f"Loaded report data with ID: {report_id}")
-        return report_data
+        return self._load('reports', report_id, 'report')
 
     def delete_report(self, report_id: str) -> bool:
         """
@@ -298,61 +758,35 @@ class JsonStorageService(StorageProvider):
         Returns:
             True if deletion was successful, False otherwise
         """
-        file_path = self.storage_dir / 'reports' / f"{report_id}.json"
-
-        if not file_path.exists():
-            logging.warning(f"Report with ID {report_id} not found for deletion")
-            return False
-
-        try:
-            file_path.unlink()
-            logging.info(f"Deleted report with ID: {report_id}")
-            return True
-        except Exception as e:
-            logging.error(f"Error deleting report {report_id}: {e}")
-            return False
+        return self._delete('reports', report_id, 'report')
 
-    def list_reports(self, portfolio_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list_reports(
+            self,
+            portfolio_id: Optional[str] = None,
+            limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         List all reports, optionally filtered by portfolio.
 
         Args:
             portfolio_id: Optional portfolio ID to filter by
+            limit: Optional maximum number of reports to return, newest first
 
         Returns:
             List of dictionaries with report metadata
         """
         reports_dir = self.storage_dir / 'reports'
-        report_files = list(reports_dir.glob('*.json'))
 
         reports = []
-        for file_path in report_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+        for _, report_info in self._read_all_metadata(reports_dir, _report_metadata, 'report'):
+            # Filter by portfolio ID if specified
+            if portfolio_id is not None and report_info['portfolio_id'] != portfolio_id:
+                continue
 
-                # Filter by portfolio ID if specified
-                if portfolio_id is not None and data.get('portfolio_id') != portfolio_id:
-                    continue
+            reports.append(dict(report_info))
 
-                # Extract metadata
-                report_info = {
-                    'id': data.get('id', file_path.stem),
-                    'name': data.get('name', ''),
-                    'portfolio_id': data.get('portfolio_id', ''),
-                    'report_type': data.get('report_type', ''),
-                    'created_at': data.get('created_at', ''),
-                    'file_path': data.get('file_path', '')
-                }
-
-                reports.append(report_info)
-            except Exception as e:
-                logging.error(f"Error reading report file {file_path.name}: {e}")
-
-        # Sort by creation date, newest first
-        reports.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-
-        return reports
+        # Newest first
+        return _newest_first(reports, limit)
 
     def save_optimization_result(
             self,
@@ -369,27 +803,7 @@ class JsonStorageService(StorageProvider):
         Returns:
             Result ID
         """
-        # Use provided ID or get it from data
-        if result_id is None:
-            result_id = result_data.get('id')
-            if result_id is None:
-                raise ValueError("Optimization result ID not provided and not found in data")
-
-        # Set result ID in data
-        result_data['id'] = result_id
-
-        # Add metadata
-        if 'created_at' not in result_data:
-            result_data['created_at'] = datetime.now().isoformat()
-
-        # Save to file
-        file_path = self.storage_dir / 'optimizations' / f"{result_id}.json"
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(result_data, f, ensure_ascii=False, indent=2)
-
-        logging.info(f"Saved optimization result with ID: {result_id}")
-        return result_id
+        return self._save('optimizations', result_data, result_id, 'optimization result')
 
     def load_optimization_result(self, result_id: str) -> Dict[str, Any]:
         """
@@ -401,56 +815,35 @@ class JsonStorageService(StorageProvider):
         Returns:
             Dictionary with optimization result data
         """
-        file_path = self.storage_dir / 'optimizations' / f"{result_id}.json"
-
-        if not file_path.exists():
-            raise FileNotFoundError(f"Optimization result with ID {result_id} not found")
+        return self._load('optimizations', result_id, 'optimization result')
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            result_data = json.load(f)
-
-        logging.info(f"Loaded optimization result with ID: {result_id}")
-        return result_data
-
-    def list_optimization_results(self, portfolio_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list_optimization_results(
+            self,
+            portfolio_id: Optional[str] = None,
+            limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         List all optimization results, optionally filtered by portfolio.
 
         Args:
             portfolio_id: Optional portfolio ID to filter by
+            limit: Optional maximum number of optimization results to return, newest first
 
         Returns:
             List of dictionaries with optimization result metadata
         """
         optimizations_dir = self.storage_dir / 'optimizations'
-        optimization_files = list(optimizations_dir.glob('*.json'))
 
         results = []
-        for file_path in optimization_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                # Filter by portfolio ID if specified
-                if portfolio_id is not None and data.get('portfolio_id') != portfolio_id:
-                    continue
+        for _, result_info in self._read_all_metadata(optimizations_dir, _optimization_metadata, 'optimization'):
+            # Filter by portfolio ID if specified
+            if portfolio_id is not None and result_info['portfolio_id'] != portfolio_id:
+                continue
 
-                # Extract metadata
-                result_info = {
-                    'id': data.get('id', file_path.stem),
-                    'portfolio_id': data.get('portfolio_id', ''),
-                    'method': data.get('method', ''),
-                    'created_at': data.get('created_at', '')
-                }
+            results.append(dict(result_info))
 
-                results.append(result_info)
-            except Exception as e:
-                logging.error(f"Error reading optimization file {file_path.name}: {e}")
-
-        # Sort by creation date, newest first
-        results.sort(key=lambda x: x.get('created_at', ''), reverse=True)
-
-        return results
+        # Newest first
+        return _newest_first(results, limit)
 
     def save_object(
             self,
@@ -469,137 +862,565 @@ class JsonStorageService(StorageProvider):
         Returns:
             Object ID
         """
-        # Use provided ID or get it from data
-        if object_id is None:
-            object_id = object_data.get('id')
-            if object_id is None:
-                raise ValueError(f"{object_type} ID not provided and not found in data")
+        return self._save(self._get_object_dir(object_type), object_data, object_id, object_type, stamp_updated=True)
+
+    def load_object(self, object_type: str, object_id: str) -> Dict[str, Any]:
+        """
+        Load generic object data.
+
+        Args:
+            object_type: Type of object
+            object_id: Object ID
+
+        Returns:
+            Dictionary with object data
+        """
+        return self._load(self._get_object_dir(object_type), object_id, object_type)
+
+    def delete_object(self, object_type: str, object_id: str) -> bool:
+        """
+        Delete generic object data.
 
-        # Set object ID in data
-        object_data['id'] = object_id
+        Args:
+            object_type: Type of object
+            object_id: Object ID
 
-        # Add metadata
-        if 'created_at' not in object_data:
-            object_data['created_at'] = datetime.now().isoformat()
+        Returns:
+            True if deletion was successful, False otherwise
+        """
+        return self._delete(self._get_object_dir(object_type), object_id, object_type)
+
+    def list_objects(
+            self,
+            object_type: str,
+            filter_criteria: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List all objects of a specific type, optionally filtered.
 
-        object_data['last_updated'] = datetime.now().isoformat()
+        Args:
+            object_type: Type of object
+            filter_criteria: Optional dictionary with filter criteria
 
+        Returns:
+            List of dictionaries with object metadata
+        """
         # Determine directory based on object type
         object_dir = self._get_object_dir(object_type)
 
-        # Save to file
-        file_path = self.storage_dir / object_dir / f"{object_id}.json"
+        # Filter criteria as a tuple, built once for all files
+        criteria = tuple(filter_criteria.items()) if filter_criteria else ()
+        criteria_keys = frozenset(key for key, _ in criteria)
+
+        def keep(file_path: Path, metadata: Dict[str, Any]) -> bool:
+            # Filtering on a nested value needs the full document, the only read that can fail here
+            values = metadata['fields']
+            if not criteria_keys.isdisjoint(metadata['nested']):
+                try:
+                    values = _read_document(file_path)
+                except Exception as e:
+                    logger.error("Error reading %s file %s: %s", object_type, file_path.name, e)
+                    return False
+            return _matches(values, criteria)
+
+        entries = self._read_all_metadata(self.storage_dir / object_dir, _object_metadata, object_type)
+        objects = [
+            dict(metadata['info'])
+            for file_path, metadata in entries
+            if not criteria or keep(file_path, metadata)
+        ]
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(object_data, f, ensure_ascii=False, indent=2)
+        # Sort by last updated, newest first
+        objects.sort(key=lambda x: x.get('last_updated', ''), reverse=True)
 
-        logging.info(f"Saved {object_type} data with ID: {object_id}")
-        return object_id
+        return objects
 
-    def load_object(self, object_type: str, object_id: str) -> Dict[str, Any]:
+    def save_many(
+            self,
+            object_type: str,
+            items: List[Tuple[Optional[str], Dict[str, Any]]]
+    ) -> List[str]:
         """
-        Load generic object data.
+        Save several objects of one type, writing them in parallel.
+        When an ID appears more than once, the last item with it is saved, as if the
+        items were saved one after another.
 
         Args:
             object_type: Type of object
-            object_id: Object ID
+            items: List of (optional object ID, object data) tuples
 
         Returns:
-            Dictionary with object data
+            Object IDs, in input order
         """
-        # Determine directory based on object type
         object_dir = self._get_object_dir(object_type)
+        now = datetime.now().isoformat()
 
-        file_path = self.storage_dir / object_dir / f"{object_id}.json"
+        documents = [
+            (self._stamp_document(object_data, object_id, object_type, now, True), object_data)
+            for object_id, object_data in items
+        ]
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"{object_type} with ID {object_id} not found")
+        # One write per file: two threads replacing the same path would race on its index entry
+        latest = dict(documents)
+        list(_get_io_pool().map(lambda document: self._write_document(object_dir, *document), latest.items()))
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            object_data = json.load(f)
+        logger.info("Saved %s %s objects", len(latest), object_type)
+        return [object_id for object_id, _ in documents]
 
-        logging.info(f"Loaded {object_type} data with ID: {object_id}")
-        return object_data
+    def load_many(self, object_type: str, object_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Load several objects of one type, reading them in parallel.
 
-    def delete_object(self, object_type: str, object_id: str) -> bool:
+        Args:
+            object_type: Type of object
+            object_ids: Object IDs
+
+        Returns:
+            Dictionary mapping object ID to object data
+
+        Raises:
+            FileNotFoundError: If any of the objects doesn't exist
         """
-        Delete generic object data.
+        object_dir = self._get_object_dir(object_type)
+
+        objects = dict(zip(
+            object_ids,
+            _get_io_pool().map(lambda object_id: self._read_cached(object_dir, object_id, object_type), object_ids)
+        ))
+
+        logger.info("Loaded %s %s objects", len(objects), object_type)
+        return objects
+
+    async def save_portfolio_async(
+            self,
+            portfolio_data: Dict[str, Any],
+            portfolio_id: Optional[str] = None
+    ) -> str:
+        """
+        Save portfolio data without blocking the event loop.
+
+        Args:
+            portfolio_data: Dictionary with portfolio data
+            portfolio_id: Optional portfolio ID
+
+        Returns:
+            Portfolio ID
+        """
+        return await asyncio.to_thread(self.save_portfolio, portfolio_data, portfolio_id)
+
+    async def load_portfolio_async(self, portfolio_id: str) -> Dict[str, Any]:
+        """
+        Load portfolio data without blocking the event loop.
+
+        Args:
+            portfolio_id: Portfolio ID
+
+        Returns:
+            Dictionary with portfolio data
+        """
+        return await asyncio.to_thread(self.load_portfolio, portfolio_id)
+
+    async def list_portfolios_async(self) -> List[Dict[str, Any]]:
+        """
+        List all portfolios without blocking the event loop.
+
+        Returns:
+            List of dictionaries with portfolio metadata
+        """
+        return await asyncio.to_thread(self.list_portfolios)
+
+    async def save_object_async(
+            self,
+            object_type: str,
+            object_data: Dict[str, Any],
+            object_id: Optional[str] = None
+    ) -> str:
+        """
+        Save generic object data without blocking the event loop.
+
+        Args:
+            object_type: Type of object
+            object_data: Dictionary with object data
+            object_id: Optional object ID
+
+        Returns:
+            Object ID
+        """
+        return await asyncio.to_thread(self.save_object, object_type, object_data, object_id)
+
+    async def load_object_async(self, object_type: str, object_id: str) -> Dict[str, Any]:
+        """
+        Load generic object data without blocking the event loop.
 
         Args:
             object_type: Type of object
             object_id: Object ID
 
         Returns:
-            True if deletion was successful, False otherwise
+            Dictionary with object data
         """
-        # Determine directory based on object type
-        object_dir = self._get_object_dir(object_type)
+        return await asyncio.to_thread(self.load_object, object_type, object_id)
 
-        file_path = self.storage_dir / object_dir / f"{object_id}.json"
+    def _save(
+            self,
+            subdir: str,
+            data: Dict[str, Any],
+            object_id: Optional[str],
+            label: str,
+            stamp_updated: bool = False
+    ) -> str:
+        """
+        Save a document, stamping its ID and timestamps.
 
-        if not file_path.exists():
-            logging.warning(f"{object_type} with ID {object_id} not found for deletion")
+        Args:
+            subdir: Subdirectory to save in
+            data: Dictionary with document data
+            object_id: Optional document ID; taken from the data when omitted
+            label: Object kind used in messages
+            stamp_updated: Whether to set 'last_updated'
+
+        Returns:
+            Document ID
+        """
+        object_id = self._stamp_document(data, object_id, label, datetime.now().isoformat(), stamp_updated)
+        self._write_document(subdir, object_id, data)
+
+        logger.info("Saved %s data with ID: %s", label, object_id)
+        return object_id
+
+    @staticmethod
+    def _stamp_document(
+            data: Dict[str, Any],
+            object_id: Optional[str],
+            label: str,
+            now: str,
+            stamp_updated: bool
+    ) -> str:
+        """
+        Resolve a document's ID and set its ID and timestamps.
+
+        Args:
+            data: Dictionary with document data
+            object_id: Optional document ID; taken from the data when omitted
+            label: Object kind used in messages
+            now: Current time in ISO format
+            stamp_updated: Whether to set 'last_updated'
+
+        Returns:
+            Document ID
+        """
+        # Use provided ID or get it from data
+        if object_id is None:
+            object_id = data.get('id')
+            if object_id is None:
+                raise ValueError(f"{label.capitalize()} ID not provided and not found in data")
+
+        data['id'] = object_id
+        data.setdefault('created_at', now)
+        if stamp_updated:
+            data['last_updated'] = now
+
+        return object_id
+
+    def _write_document(self, subdir: str, object_id: str, data: Dict[str, Any]) -> None:
+        """
+        Write a document atomically and drop its cached listing metadata.
+        A copy of the document in the other storage format is removed.
+
+        Args:
+            subdir: Subdirectory to save in
+            object_id: Document ID
+            data: Dictionary with document data
+        """
+        file_path = self.storage_dir / subdir / f"{object_id}{self._extension}"
+
+        _atomic_write(file_path, self._dump_document(data))
+        self._invalidate_metadata(file_path)
+        self._forget_cached(subdir, object_id)
+
+        other_path = file_path.with_suffix(self._other_extension)
+        try:
+            other_path.unlink()
+            self._invalidate_metadata(other_path)
+        except FileNotFoundError:
+            pass
+
+    def _find_document(self, subdir: str, object_id: str) -> Optional[Path]:
+        """
+        Find a document's file, in the current storage format or the other one.
+
+        Args:
+            subdir: Subdirectory the document is in
+            object_id: Document ID
+
+        Returns:
+            Document file path, or None if the document doesn't exist
+        """
+        for extension in (self._extension, self._other_extension):
+            file_path = self.storage_dir / subdir / f"{object_id}{extension}"
+            if file_path.exists():
+                return file_path
+        return None
+
+    def _load(self, subdir: str, object_id: str, label: str) -> Dict[str, Any]:
+        """
+        Load a document.
+
+        Args:
+            subdir: Subdirectory the document is in
+            object_id: Document ID
+            label: Object kind used in messages
+
+        Returns:
+            Dictionary with document data
+        """
+        data = self._read_cached(subdir, object_id, label)
+
+        logger.debug("Loaded %s data with ID: %s", label, object_id)
+        return data
+
+    def _read_cached(self, subdir: str, object_id: str, label: str) -> Dict[str, Any]:
+        """
+        Read a document through the object cache.
+        A cached copy is used only while the file's name, mtime and size are unchanged.
+
+        Args:
+            subdir: Subdirectory the document is in
+            object_id: Document ID
+            label: Object kind used in messages
+
+        Returns:
+            Copy of the document data, safe for the caller to modify
+        """
+        file_path = self._find_document(subdir, object_id)
+
+        if file_path is None:
+            raise FileNotFoundError(f"{label.capitalize()} with ID {object_id} not found")
+
+        stat = file_path.stat()
+        key = (subdir, object_id)
+        version = (file_path.name, stat.st_mtime_ns, stat.st_size)
+
+        with self._object_cache_lock:
+            cached = self._object_cache.get(key)
+            if cached is not None and cached[:3] == version:
+                self._object_cache.move_to_end(key)
+                return _copy_document(cached[3])
+
+        data = _read_document(file_path)
+
+        with self._object_cache_lock:
+            self._object_cache[key] = version + (data,)
+            self._object_cache.move_to_end(key)
+            while len(self._object_cache) > OBJECT_CACHE_SIZE:
+                self._object_cache.popitem(last=False)
+
+        return _copy_document(data)
+
+    def _forget_cached(self, subdir: str, object_id: str) -> None:
+        """
+        Drop a document from the object cache.
+
+        Args:
+            subdir: Subdirectory the document is in
+            object_id: Document ID
+        """
+        with self._object_cache_lock:
+            self._object_cache.pop((subdir, object_id), None)
+
+    def _delete(self, subdir: str, object_id: str, label: str) -> bool:
+        """
+        Delete a document.
+
+        Args:
+            subdir: Subdirectory the document is in
+            object_id: Document ID
+            label: Object kind used in messages
+
+        Returns:
+            True if deletion was successful, False otherwise
+        """
+        file_path = self._find_document(subdir, object_id)
+
+        if file_path is None:
+            logger.warning("%s with ID %s not found for deletion", label.capitalize(), object_id)
             return False
 
         try:
             file_path.unlink()
-            logging.info(f"Deleted {object_type} with ID: {object_id}")
+            self._invalidate_metadata(file_path)
+            self._forget_cached(subdir, object_id)
+            logger.info("Deleted %s with ID: %s", label, object_id)
             return True
         except Exception as e:
-            logging.error(f"Error deleting {object_type} {object_id}: {e}")
+            logger.error("Error deleting %s %s: %s", label, object_id, e)
             return False
 
-    def list_objects(
+    def _get_metadata(
             self,
-            object_type: str,
-            filter_criteria: Optional[Dict[str, Any]] = None
-    ) -> List[Dict[str, Any]]:
+            file_path: Path,
+            extractor: Callable[[Dict[str, Any], Path], Dict[str, Any]],
+            stat: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
         """
-        List all objects of a specific type, optionally filtered.
+        Get listing metadata for a file, parsing it only when it changed since the last call.
 
         Args:
-            object_type: Type of object
-            filter_criteria: Optional dictionary with filter criteria
+            file_path: Document file path
+            extractor: Function building the metadata from the parsed data and file path
+            stat: File stat, if the caller already has it
 
         Returns:
-            List of dictionaries with object metadata
+            Cached metadata; callers must copy it before handing it out
         """
-        # Determine directory based on object type
-        object_dir = self._get_object_dir(object_type)
+        if stat is None:
+            stat = file_path.stat()
+        subdir = file_path.parent.name
+        dir_cache = self._get_dir_cache(subdir, extractor.__name__)
+
+        cached = dir_cache.get(file_path.name)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        metadata = None
+        if STREAM_PORTFOLIO_METADATA and extractor is _portfolio_metadata and file_path.suffix == '.json':
+            metadata = _stream_portfolio_metadata(file_path)
+        if metadata is None:
+            metadata = _materialize(extractor(_parse_document_lazy(file_path.read_bytes()), file_path))
+        dir_cache[file_path.name] = (stat.st_mtime_ns, stat.st_size, metadata)
+        self._dirty_indexes.add(subdir)
+        return metadata
+
+    def _read_all_metadata(
+            self,
+            directory: Path,
+            extractor: Callable[[Dict[str, Any], Path], Dict[str, Any]],
+            label: str
+    ) -> List[Tuple[Path, Dict[str, Any]]]:
+        """
+        Get listing metadata for every document file in a directory, reading changed files in parallel.
+        Files that can't be read are logged and skipped; the directory's metadata index is
+        rewritten when anything changed.
 
-        object_files = list((self.storage_dir / object_dir).glob('*.json'))
+        Args:
+            directory: Directory to list
+            extractor: Function building the metadata from the parsed data and file path
+            label: Object kind used in error messages
 
-        objects = []
-        for file_path in object_files:
+        Returns:
+            List of (file path, cached metadata) tuples, in directory order
+        """
+        with os.scandir(directory) as entries:
+            document_entries = [
+                entry for entry in entries
+                if entry.name.endswith(self._document_suffixes) and entry.is_file()
+            ]
+
+        def read(entry: os.DirEntry) -> Optional[Tuple[Path, Dict[str, Any]]]:
+            file_path = Path(entry.path)
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                # Apply filters if specified
-                if filter_criteria:
-                    if not all(data.get(key) == value for key, value in filter_criteria.items()):
-                        continue
-
-                # Extract metadata
-                object_info = {
-                    'id': data.get('id', file_path.stem),
-                    'created_at': data.get('created_at', ''),
-                    'last_updated': data.get('last_updated', '')
-                }
-
-                # Add common metadata fields if present
-                for field in ['name', 'description', 'type']:
-                    if field in data:
-                        object_info[field] = data[field]
-
-                objects.append(object_info)
+                return file_path, self._get_metadata(file_path, extractor, entry.stat())
             except Exception as e:
-                logging.error(f"Error reading {object_type} file {file_path.name}: {e}")
+                logger.error("Error reading %s file %s: %s", label, entry.name, e)
+                return None
 
-        # Sort by last updated, newest first
-        objects.sort(key=lambda x: x.get('last_updated', ''), reverse=True)
+        if len(document_entries) > 1:
+            read_results = _get_io_pool().map(read, document_entries)
+        else:
+            read_results = map(read, document_entries)
 
-        return objects
+        results = [result for result in read_results if result is not None]
+
+        # Forget files that were removed outside this service
+        subdir = directory.name
+        dir_cache = self._get_dir_cache(subdir, extractor.__name__)
+        names = {entry.name for entry in document_entries}
+        for name in [name for name in dir_cache if name not in names]:
+            dir_cache.pop(name, None)
+            self._dirty_indexes.add(subdir)
+
+        if subdir in self._dirty_indexes:
+            self._save_metadata_index(subdir)
+
+        return results
+
+    def _get_dir_cache(self, subdir: str, extractor_name: str) -> Dict[str, Tuple[int, int, Dict[str, Any]]]:
+        """
+        Get the metadata cache for a subdirectory and extractor, loading the subdirectory's index first.
+
+        Args:
+            subdir: Subdirectory name
+            extractor_name: Metadata extractor function name
+
+        Returns:
+            Mapping of filename to (st_mtime_ns, st_size, metadata)
+        """
+        if subdir not in self._loaded_indexes:
+            with self._index_lock:
+                if subdir not in self._loaded_indexes:
+                    self._load_metadata_index(subdir)
+                    self._loaded_indexes.add(subdir)
+
+        return self._meta_cache.setdefault((subdir, extractor_name), {})
+
+    def _load_metadata_index(self, subdir: str) -> None:
+        """
+        Load a subdirectory's persisted metadata index into the in-memory cache.
+        Entries are still validated against each file's mtime and size before use.
+
+        Args:
+            subdir: Subdirectory name
+        """
+        index_path = self.storage_dir / subdir / METADATA_INDEX_FILENAME
+
+        try:
+            index = _read_json_file(index_path)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning("Ignoring unreadable metadata index %s: %s", index_path, e)
+            return
+
+        if not isinstance(index, dict) or index.get('version') != METADATA_INDEX_VERSION:
+            logger.debug("Rebuilding outdated metadata index %s", index_path)
+            return
+
+        for extractor_name, entries in index['extractors'].items():
+            dir_cache = self._meta_cache.setdefault((subdir, extractor_name), {})
+            for name, (mtime_ns, size, metadata) in entries.items():
+                dir_cache.setdefault(name, (mtime_ns, size, metadata))
+
+    def _save_metadata_index(self, subdir: str) -> None:
+        """
+        Persist a subdirectory's metadata cache to its index file.
+
+        Args:
+            subdir: Subdirectory name
+        """
+        self._dirty_indexes.discard(subdir)
+        extractors = {
+            extractor_name: {name: list(entry) for name, entry in list(dir_cache.items())}
+            for (cache_subdir, extractor_name), dir_cache in list(self._meta_cache.items())
+            if cache_subdir == subdir
+        }
+        index = {'version': METADATA_INDEX_VERSION, 'extractors': extractors}
+
+        index_path = self.storage_dir / subdir / METADATA_INDEX_FILENAME
+        try:
+            _atomic_write(index_path, _dump_json_bytes(index))
+        except OSError as e:
+            logger.warning("Could not write metadata index %s: %s", index_path, e)
+
+    def _invalidate_metadata(self, file_path: Path) -> None:
+        """
+        Drop cached listing metadata for a file that is being written or deleted.
+
+        Args:
+            file_path: Document file path
+        """
+        for (subdir, _), dir_cache in list(self._meta_cache.items()):
+            if subdir == file_path.parent.name and dir_cache.pop(file_path.name, None) is not None:
+                self._dirty_indexes.add(subdir)
 
     def _get_object_dir(self, object_type: str) -> str:
         """
@@ -611,20 +1432,13 @@ class JsonStorageService(StorageProvider):
         Returns:
             Directory name
         """
-        # Map object types to directories
-        type_dirs = {
-            'portfolio': 'portfolios',
-            'report': 'reports',
-            'optimization': 'optimizations',
-            'scenario': 'scenarios',
-            'template': 'templates'
-        }
-
-        # Get directory or use object_type as fallback
-        directory = type_dirs.get(object_type.lower(), object_type.lower())
-
-        # Create directory if it doesn't exist
-        dir_path = self.storage_dir / directory
-        dir_path.mkdir(exist_ok=True)
+        key = object_type.lower()
+        directory = self._type_dir_cache.get(key)
+
+        if directory is None:
+            # Unknown types use their own name as directory, created on first use
+            directory = key
+            (self.storage_dir / directory).mkdir(exist_ok=True)
+            self._type_dir_cache[key] = directory
 
         return directory
\ No newline at end of file
@@ -2,14 +2,216 @@
 Pickle storage implementation for efficient serialization of complex objects.
 """
 import os
+import json
+import heapq
+import mmap
 import pickle
+import struct
 import logging
-from datetime import datetime
+import threading
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Iterable, Tuple
 
 from app.core.interfaces.storage_provider import StorageProvider
 
+# Suffix of the JSON metadata sidecar saved next to each <id>.pkl, so listings don't unpickle whole documents
+METADATA_SUFFIX = '.meta.json'
+
+# Leading bytes of a pickle file that carries out-of-band buffers after its pickle stream;
+# plain pickle streams start with the PROTO opcode (0x80) instead
+BUFFERED_PICKLE_MAGIC = b'QPBUF\x00\x00\x01'
+
+# Buffer data in pickle files starts on this boundary
+BUFFER_ALIGNMENT = 64
+
+# Top-level values copied into sidecars; for any other value only its length is recorded.
+# Lists of scalars (e.g. tags) are copied too when they have at most _SIDECAR_MAX_LIST_LENGTH items
+_SIDECAR_SCALAR_TYPES = (str, int, float, bool, type(None))
+_SIDECAR_MAX_LIST_LENGTH = 32
+
+# Keys listings copy out of each document
+_PORTFOLIO_KEYS = ('id', 'name', 'created_at', 'last_updated', 'description', 'tags')
+_REPORT_KEYS = ('id', 'name', 'portfolio_id', 'report_type', 'created_at', 'file_path')
+_OPTIMIZATION_KEYS = ('id', 'portfolio_id', 'method', 'created_at')
+_OBJECT_KEYS = ('id', 'created_at', 'last_updated', 'name', 'description', 'type')
+
+
+def _build_sidecar(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the metadata sidecar for a document
+
+    Args:
+        data: Document data
+
+    Returns:
+        JSON-serializable dictionary with 'fields' (top-level simple values, dates as ISO
+        strings), 'dates' (type name of each date field) and 'sizes' (lengths of the other
+        top-level values, None when a value has no length)
+    """
+    fields = {}
+    dates = {}
+    sizes = {}
+    for key, value in data.items():
+        if isinstance(value, (datetime, date)):
+            fields[key] = value.isoformat()
+            dates[key] = 'datetime' if isinstance(value, datetime) else 'date'
+        elif isinstance(value, _SIDECAR_SCALAR_TYPES):
+            fields[key] = value
+        elif (isinstance(value, list) and len(value) <= _SIDECAR_MAX_LIST_LENGTH
+              and all(isinstance(item, _SIDECAR_SCALAR_TYPES) for item in value)):
+            fields[key] = value
+        else:
+            try:
+                sizes[key] = len(value)
+            except TypeError:
+                sizes[key] = None
+
+    return {'fields': fields, 'dates': dates, 'sizes': sizes}
+
+
+def _sidecar_view(
+        sidecar: Dict[str, Any],
+        copied: Iterable[str],
+        counted: Iterable[str] = ()
+) -> Optional[Dict[str, Any]]:
+    """
+    Rebuild the part of a document a listing needs from its sidecar
+
+    Args:
+        sidecar: Metadata sidecar
+        copied: Keys whose values the listing reads
+        counted: Keys whose values the listing only takes len() of
+
+    Returns:
+        Dictionary usable in place of the document for those keys, or None if the
+        sidecar doesn't hold them and the document has to be loaded
+    """
+    fields = sidecar['fields']
+    dates = sidecar['dates']
+    sizes = sidecar['sizes']
+
+    view = {}
+    for key in copied:
+        if key in sizes:
+            return None
+        if key in fields:
+            value = fields[key]
+            if key in dates:
+                # Listings sort on these, so they keep the type the pickle holds
+                value = datetime.fromisoformat(value) if dates[key] == 'datetime' else date.fromisoformat(value)
+            view[key] = value
+
+    for key in counted:
+        if key in fields:
+            if not isinstance(fields[key], list):
+                return None
+            view[key] = fields[key]
+        elif key in sizes:
+            if sizes[key] is None:
+                return None
+            # Stands in for the value: same len(), nothing materialized
+            view[key] = range(sizes[key])
+
+    return view
+
+
+def _dump_pickle(file_path: Path, data: Any) -> None:
+    """
+    Pickle data with protocol 5, keeping large buffers (NumPy arrays, pandas blocks) out of the
+    pickle stream. Buffers are appended after the stream in the same file, which is replaced
+    atomically, so the pickle and its buffers are always written and read together.
+
+    Args:
+        file_path: Pickle file path
+        data: Data to pickle
+    """
+    buffers = []
+    # Returning None from the callback keeps each buffer out of band
+    payload = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+
+    if not buffers:
+        _atomic_write(file_path, [payload])
+        return
+
+    # Header, pickle stream, then each buffer as its length followed by its bytes, padded so
+    # the bytes start aligned
+    chunks = [BUFFERED_PICKLE_MAGIC, struct.pack('<Q', len(payload)), payload]
+    offset = len(BUFFERED_PICKLE_MAGIC) + 8 + len(payload)
+    views = [buffer.raw() for buffer in buffers]
+    for view in views:
+        header_offset = offset + -offset % 8
+        data_offset = header_offset + 8 + -(header_offset + 8) % BUFFER_ALIGNMENT
+        chunks.append(b'\0' * (header_offset - offset) + struct.pack('<Q', view.nbytes))
+        chunks.append(b'\0' * (data_offset - header_offset - 8))
+        chunks.append(view)
+        offset = data_offset + view.nbytes
+
+    try:
+        _atomic_write(file_path, chunks)
+    finally:
+        for view in views:
+            view.release()
+
+
+def _load_pickle(file_path: Path) -> Any:
+    """
+    Load a pickle written by _dump_pickle. The file is memory-mapped while it is unpickled;
+    each out-of-band buffer is copied once into its own bytearray, so loaded arrays are writable
+    and don't keep the mapping or its file descriptor open.
+
+    Args:
+        file_path: Pickle file path
+
+    Returns:
+        Unpickled data
+    """
+    with open(file_path, 'rb') as f:
+        if f.read(len(BUFFERED_PICKLE_MAGIC)) != BUFFERED_PICKLE_MAGIC:
+            f.seek(0)
+            return pickle.load(f)
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            offset = len(BUFFERED_PICKLE_MAGIC)
+            payload_size, = struct.unpack_from('<Q', view, offset)
+            offset += 8
+            payload_start = offset
+            offset += payload_size
+
+            buffers = []
+            while offset < len(view):
+                offset += -offset % 8
+                size, = struct.unpack_from('<Q', view, offset)
+                offset += 8
+                offset += -offset % BUFFER_ALIGNMENT
+                buffers.append(bytearray(view[offset:offset + size]))
+                offset += size
+
+            # Unpickling copies everything it reads from the stream itself, so the slice can be
+            # released before the map is closed
+            with view[payload_start:payload_start + payload_size] as payload:
+                return pickle.loads(payload, buffers=buffers)
+
+
+def _atomic_write(file_path: Path, chunks: Iterable[Union[bytes, memoryview]]) -> None:
+    """
+    Write a file through a temporary sibling and os.replace, so readers never see a partial file
+    and memory maps of the previous file keep their contents
+
+    Args:
+        file_path: Destination path
+        chunks: File contents, in order
+    """
+    tmp_path = file_path.with_name(f"{file_path.name}.tmp.{os.getpid()}.{threading.get_ident()}")
+    try:
+        with open(tmp_path, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 class PickleStorageService(StorageProvider):
     """
@@ -77,8 +279,9 @@ class PickleStorageService(StorageProvider):
         # Save to file
         file_path = self.storage_dir / 'portfolios' / f"{portfolio_id}.pkl"
 
-        with open(file_path, 'wb') as f:
-            pickle.dump(portfolio_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        _dump_pickle(file_path, portfolio_data)
+
+        self._save_sidecar(file_path, portfolio_data)
 
         logging.info(f"Saved portfolio data with ID: {portfolio_id}")
         return portfolio_id
@@ -99,8 +302,7 @@ class PickleStorageService(StorageProvider):
             raise FileNotFoundError(f"Portfolio with ID {portfolio_id} not found")
 
         try:
-            with open(file_path, 'rb') as f:
-                portfolio_data = pickle.load(f)
+            portfolio_data = _load_pickle(file_path)
 
             logging.info(f"Loaded portfolio data with ID: {portfolio_id}")
             return portfolio_data
@@ -126,6 +328,7 @@ class PickleStorageService(StorageProvider):
 
         try:
             file_path.unlink()
+            self._delete_sidecar(file_path)
             logging.info(f"Deleted portfolio with ID: {portfolio_id}")
             return True
         except Exception as e:
@@ -140,14 +343,10 @@ class PickleStorageService(StorageProvider):
             List of dictionaries with portfolio metadata
         """
         portfolio_dir = self.storage_dir / 'portfolios'
-        portfolio_files = list(portfolio_dir.glob('*.pkl'))
 
         portfolios = []
-        for file_path in portfolio_files:
+        for file_path, data in self._read_listing(portfolio_dir, _PORTFOLIO_KEYS, ('assets',), 'portfolio'):
             try:
-                with open(file_path, 'rb') as f:
-                    data = pickle.load(f)
-
                 # Extract metadata
                 portfolio_info = {
                     'id': data.get('id', file_path.stem),
@@ -155,7 +354,8 @@ class PickleStorageService(StorageProvider):
                     'created_at': data.get('created_at', ''),
                     'last_updated': data.get('last_updated', ''),
                     'asset_count': len(data.get('assets', [])),
-                    'description': data.get('description', '')
+                    'description': data.get('description', ''),
+                    'tags': data.get('tags', [])
                 }
 
                 portfolios.append(portfolio_info)
@@ -198,8 +398,9 @@ class PickleStorageService(StorageProvider):
         # Save to file
         file_path = self.storage_dir / 'reports' / f"{report_id}.pkl"
 
-        with open(file_path, 'wb') as f:
-            pickle.dump(report_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        _dump_pickle(file_path, report_data)
+
+        self._save_sidecar(file_path, report_data)
 
         logging.info(f"Saved report data with ID: {report_id}")
         return report_id
@@ -220,8 +421,7 @@ class PickleStorageService(StorageProvider):
             raise FileNotFoundError(f"Report with ID {report_id} not found")
 
         try:
-            with open(file_path, 'rb') as f:
-                report_data = pickle.load(f)
+            report_data = _load_pickle(file_path)
 
             logging.info(f"Loaded report data with ID: {report_id}")
             return report_data
@@ -247,31 +447,33 @@ class PickleStorageService(StorageProvider):
 
         try:
             file_path.unlink()
+            self._delete_sidecar(file_path)
             logging.info(f"Deleted report with ID: {report_id}")
             return True
         except Exception as e:
             logging.error(f"Error deleting report {report_id}: {e}")
             return False
 
-    def list_reports(self, portfolio_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list_reports(
+            self,
+            portfolio_id: Optional[str] = None,
+            limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         List all reports, optionally filtered by portfolio.
 
         Args:
             portfolio_id: Optional portfolio ID to filter by
+            limit: Optional maximum number of reports to return, newest first
 
         Returns:
             List of dictionaries with report metadata
         """
         reports_dir = self.storage_dir / 'reports'
-        report_files = list(reports_dir.glob('*.pkl'))
 
         reports = []
-        for file_path in report_files:
+        for file_path, data in self._read_listing(reports_dir, _REPORT_KEYS, (), 'report'):
             try:
-                with open(file_path, 'rb') as f:
-                    data = pickle.load(f)
-
                 # Filter by portfolio ID if specified
                 if portfolio_id is not None and data.get('portfolio_id') != portfolio_id:
                     continue
@@ -290,7 +492,10 @@ class PickleStorageService(StorageProvider):
             except Exception as e:
                 logging.error(f"Error reading report file {file_path.name}: {e}")
 
-        # Sort by creation date, newest first
+        # Sort by creation date, newest first; a limit only needs the top entries
+        if limit:
+            return heapq.nlargest(limit, reports, key=lambda x: x.get('created_at', ''))
+
         reports.sort(key=lambda x: x.get('created_at', ''), reverse=True)
 
         return reports
@@ -326,8 +531,9 @@ class PickleStorageService(StorageProvider):
         # Save to file
         file_path = self.storage_dir / 'optimizations' / f"{result_id}.pkl"
 
-        with open(file_path, 'wb') as f:
-            pickle.dump(result_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        _dump_pickle(file_path, result_data)
+
+        self._save_sidecar(file_path, result_data)
 
         logging.info(f"Saved optimization result with ID: {result_id}")
         return result_id
@@ -348,8 +554,7 @@ class PickleStorageService(StorageProvider):
             raise FileNotFoundError(f"Optimization result with ID {result_id} not found")
 
         try:
-            with open(file_path, 'rb') as f:
-                result_data = pickle.load(f)
+            result_data = _load_pickle(file_path)
 
             logging.info(f"Loaded optimization result with ID: {result_id}")
             return result_data
@@ -357,25 +562,26 @@ class PickleStorageService(StorageProvider):
             logging.error(f"Error loading optimization result {result_id}: {e}")
             raise
 
-    def list_optimization_results(self, portfolio_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list_optimization_results(
+            self,
+            portfolio_id: Optional[str] = None,
+            limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         List all optimization results, optionally filtered by portfolio.
 
         Args:
             portfolio_id: Optional portfolio ID to filter by
+            limit: Optional maximum number of optimization results to return, newest first
 
         Returns:
             List of dictionaries with optimization result metadata
         """
         optimizations_dir = self.storage_dir / 'optimizations'
-        optimization_files = list(optimizations_dir.glob('*.pkl'))
 
         results = []
-        for file_path in optimization_files:
+        for file_path, data in self._read_listing(optimizations_dir, _OPTIMIZATION_KEYS, (), 'optimization'):
             try:
-                with open(file_path, 'rb') as f:
-                    data = pickle.load(f)
-
                 # Filter by portfolio ID if specified
                 if portfolio_id is not None and data.get('portfolio_id') != portfolio_id:
                     continue
@@ -392,7 +598,10 @@ class PickleStorageService(StorageProvider):
             except Exception as e:
                 logging.error(f"Error reading optimization file {file_path.name}: {e}")
 
-        # Sort by creation date, newest first
+        # Sort by creation date, newest first; a limit only needs the top entries
+        if limit:
+            return heapq.nlargest(limit, results, key=lambda x: x.get('created_at', ''))
+
         results.sort(key=lambda x: x.get('created_at', ''), reverse=True)
 
         return results
@@ -435,8 +644,9 @@ class PickleStorageService(StorageProvider):
         # Save to file
         file_path = self.storage_dir / object_dir / f"{object_id}.pkl"
 
-        with open(file_path, 'wb') as f:
-            pickle.dump(object_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        _dump_pickle(file_path, object_data)
+
+        self._save_sidecar(file_path, object_data)
 
         logging.info(f"Saved {object_type} data with ID: {object_id}")
         return object_id
@@ -461,8 +671,7 @@ class PickleStorageService(StorageProvider):
             raise FileNotFoundError(f"{object_type} with ID {object_id} not found")
 
         try:
-            with open(file_path, 'rb') as f:
-                object_data = pickle.load(f)
+            object_data = _load_pickle(file_path)
 
             logging.info(f"Loaded {object_type} data with ID: {object_id}")
             return object_data
@@ -492,6 +701,7 @@ class PickleStorageService(StorageProvider):
 
         try:
             file_path.unlink()
+            self._delete_sidecar(file_path)
             logging.info(f"Deleted {object_type} with ID: {object_id}")
             return True
         except Exception as e:
@@ -516,14 +726,12 @@ class PickleStorageService(StorageProvider):
         # Determine directory based on object type
         object_dir = self._get_object_dir(object_type)
 
-        object_files = list((self.storage_dir / object_dir).glob('*.pkl'))
+        # Filtering reads the criteria keys as well as the listed ones
+        keys = _OBJECT_KEYS + tuple(filter_criteria or ())
 
         objects = []
-        for file_path in object_files:
+        for file_path, data in self._read_listing(self.storage_dir / object_dir, keys, (), object_type):
             try:
-                with open(file_path, 'rb') as f:
-                    data = pickle.load(f)
-
                 # Apply filters if specified
                 if filter_criteria:
                     if not all(data.get(key) == value for key, value in filter_criteria.items()):
@@ -550,6 +758,91 @@ class PickleStorageService(StorageProvider):
 
         return objects
 
+    def _save_sidecar(self, file_path: Path, data: Dict[str, Any]) -> None:
+        """
+        Save the metadata sidecar for a pickle file.
+        Must run after the pickle is written: a sidecar older than its pickle is ignored.
+
+        Args:
+            file_path: Pickle file path
+            data: Document data
+        """
+        sidecar_path = file_path.with_suffix(METADATA_SUFFIX)
+
+        try:
+            _atomic_write(sidecar_path, [json.dumps(_build_sidecar(data)).encode('utf-8')])
+        except Exception as e:
+            # Listings fall back to the pickle itself
+            logging.warning(f"Could not write metadata sidecar {sidecar_path.name}: {e}")
+
+    def _delete_sidecar(self, file_path: Path) -> None:
+        """
+        Delete the metadata sidecar of a pickle file, if there is one.
+
+        Args:
+            file_path: Pickle file path
+        """
+        file_path.with_suffix(METADATA_SUFFIX).unlink(missing_ok=True)
+
+    def _read_listing(
+            self,
+            directory: Path,
+            copied: Iterable[str],
+            counted: Iterable[str],
+            label: str
+    ) -> List[Tuple[Path, Dict[str, Any]]]:
+        """
+        Get what a listing needs from every pickle in a directory, reading metadata sidecars
+        where they are current. Pickles without a usable sidecar are loaded, and their
+        sidecar is written for next time. Files that can't be read are logged and skipped.
+
+        Args:
+            directory: Directory to list
+            copied: Keys whose values the listing reads
+            counted: Keys whose values the listing only takes len() of
+            label: Object kind used in error messages
+
+        Returns:
+            List of (pickle path, document data or sidecar view) tuples
+        """
+        pickles = []
+        sidecars = {}
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.pkl'):
+                    pickles.append(entry)
+                elif entry.name.endswith(METADATA_SUFFIX):
+                    sidecars[entry.name[:-len(METADATA_SUFFIX)]] = entry
+
+        results = []
+        for entry in pickles:
+            file_path = Path(entry.path)
+            try:
+                data = None
+
+                # A sidecar older than its pickle was left behind by a write outside this service
+                sidecar_entry = sidecars.get(file_path.stem)
+                current = sidecar_entry is not None and sidecar_entry.stat().st_mtime_ns >= entry.stat().st_mtime_ns
+                if current:
+                    try:
+                        with open(sidecar_entry.path, 'rb') as f:
+                            data = _sidecar_view(json.load(f), copied, counted)
+                    except (ValueError, KeyError, TypeError) as e:
+                        # A damaged sidecar is rebuilt from the pickle below
+                        logging.warning(f"Ignoring unreadable metadata sidecar {sidecar_entry.name}: {e}")
+                        current = False
+
+                if data is None:
+                    data = _load_pickle(file_path)
+                    if not current:
+                        self._save_sidecar(file_path, data)
+
+                results.append((file_path, data))
+            except Exception as e:
+                logging.error(f"Error reading {label} file {file_path.name}: {e}")
+
+        return results
+
     def _get_object_dir(self, object_type: str) -> str:
         """
         Get directory for a specific object type.
@@ -595,8 +888,7 @@ class PickleStorageService(StorageProvider):
 
         file_path = self.storage_dir / 'cache' / f"{key}.pkl"
 
-        with open(file_path, 'wb') as f:
-            pickle.dump(cache_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        _dump_pickle(file_path, cache_data)
 
         logging.debug(f"Cached object with key: {key}")
 
@@ -616,13 +908,13 @@ class PickleStorageService(StorageProvider):
             return None
 
         try:
-            with open(file_path, 'rb') as f:
-                cache_data = pickle.load(f)
+            cache_data = _load_pickle(file_path)
 
             # Check expiry
             if datetime.now().timestamp() > cache_data.get('expires_at', 0):
                 logging.debug(f"Cache expired for key: {key}")
                 file_path.unlink()
+                self._delete_sidecar(file_path)
                 return None
 
             logging.debug(f"Cache hit for key: {key}")
@@ -645,6 +937,7 @@ class PickleStorageService(StorageProvider):
         for file_path in cache_files:
             try:
                 file_path.unlink()
+                self._delete_sidecar(file_path)
                 cleared_count += 1
             except Exception as e:
                 logging.error(f"Error clearing cache file {file_path.name}: {e}")
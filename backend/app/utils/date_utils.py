@@ -1,9 +1,13 @@
 # backend/app/utils/date_utils.py
 from typing import List, Union, Optional, Tuple
 from datetime import datetime, date, timedelta
+import time
 import pandas as pd
 import numpy as np
 
+# Last (epoch second, formatted string) produced by now_timestamp_str
+_last_timestamp: Tuple[int, str] = (-1, '')
+
 
 def parse_date(
         date_str: str,
@@ -45,6 +49,24 @@ def parse_date(
     return None
 
 
+def now_timestamp_str() -> str:
+    """
+    Get the current local time formatted as YYYY-MM-DD HH:MM:SS.
+
+    The string is formatted once per second and reused by later calls within that second.
+
+    Returns:
+        Formatted timestamp
+    """
+    global _last_timestamp
+
+    second = int(time.time())
+    if second != _last_timestamp[0]:
+        _last_timestamp = (second, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second)))
+
+    return _last_timestamp[1]
+
+
 def date_to_iso(date_obj: Union[datetime, date]) -> str:
     """
     Convert a date object to ISO format (YYYY-MM-DD).
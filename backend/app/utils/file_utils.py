@@ -3,7 +3,6 @@ import os
 import json
 import pickle
 import csv
-import yaml
 import tempfile
 from typing import Dict, List, Any, Optional, Union, TextIO, BinaryIO
 from pathlib import Path
@@ -14,9 +13,21 @@ import zipfile
 import gzip
 import base64
 
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Characters replaced with '_' in stored filenames: path separators, shell/Windows-reserved
+# characters and all Unicode whitespace (the highest whitespace code point is U+3000)
+FILENAME_TRANSLATION = str.maketrans(dict.fromkeys(
+    '\\/*?:"<>|%' + ''.join(c for c in map(chr, range(0x3001)) if c.isspace()),
+    '_'
+))
+
 
 def ensure_directory_exists(directory_path: Union[str, Path]) -> bool:
     """
@@ -436,6 +447,10 @@ def read_yaml_file(file_path: Union[str, Path], encoding: str = 'utf-8') -> Opti
     Returns:
         YAML data as dictionary, or None if file could not be read or parsed
     """
+    if yaml is None:
+        logger.error(f"Cannot read YAML file {file_path}: PyYAML is not installed")
+        return None
+
     try:
         path = Path(file_path)
         if not path.exists() or not path.is_file():
@@ -467,6 +482,10 @@ def write_yaml_file(
     Returns:
         True if file was written successfully, False otherwise
     """
+    if yaml is None:
+        logger.error(f"Cannot write YAML file {file_path}: PyYAML is not installed")
+        return False
+
     try:
         path = Path(file_path)
 
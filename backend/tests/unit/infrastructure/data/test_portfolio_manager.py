@@ -0,0 +1,67 @@
+"""
+Unit tests for the portfolio manager service.
+"""
+import pytest
+
+from app.core.domain.asset import Asset
+from app.core.domain.portfolio import Portfolio
+from app.infrastructure.data.portfolio_manager import PortfolioManagerService
+from app.infrastructure.storage.json_storage import JsonStorageService
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return JsonStorageService(str(tmp_path))
+
+
+@pytest.fixture
+def manager(storage):
+    return PortfolioManagerService(data_provider=None, storage_provider=storage)
+
+
+def _portfolio(portfolio_id, name, tags=None):
+    return Portfolio(
+        id=portfolio_id,
+        name=name,
+        tags=tags,
+        assets=[Asset(ticker='AAPL', weight=0.6), Asset(ticker='MSFT', weight=0.4)]
+    )
+
+
+def test_save_list_load_and_delete(manager):
+    manager.save_portfolio(_portfolio('p1', 'Growth', tags=['tech']))
+    manager.save_portfolio(_portfolio('p2', 'Alpha'))
+
+    listed = manager.list_portfolios()
+    assert [item['id'] for item in listed] == ['p2', 'p1']
+    assert listed[1]['asset_count'] == 2
+    assert listed[1]['tags'] == ['tech']
+
+    assert manager.load_portfolio('p1')['name'] == 'Growth'
+    assert manager.load_portfolio_as_object('p1').name == 'Growth'
+
+    assert manager.delete_portfolio('p1') is True
+    assert [item['id'] for item in manager.list_portfolios()] == ['p2']
+    assert manager.load_portfolio('p1') is None
+
+
+def test_listing_has_no_phantom_index_entry(manager, storage, tmp_path):
+    manager.save_portfolio(_portfolio('p1', 'Growth'))
+    manager.list_portfolios()
+    manager.list_portfolios()
+
+    assert [item['id'] for item in storage.list_portfolios()] == ['p1']
+    assert sorted(path.name for path in (tmp_path / 'portfolios').glob('*.json')) == ['p1.json']
+
+
+def test_parse_ticker_weights_text(manager):
+    assets = manager.parse_ticker_weights_text("aapl:0.6, MSFT 0.4\n\n")
+    assert assets == [{'ticker': 'AAPL', 'weight': 0.6}, {'ticker': 'MSFT', 'weight': 0.4}]
+
+    equal = manager.parse_ticker_weights_text("AAPL, MSFT")
+    assert [asset['weight'] for asset in equal] == [0.5, 0.5]
+
+
+def test_parse_ticker_weights_text_rejects_malformed_weight(manager):
+    with pytest.raises(ValueError, match="AAPL:1.2.3"):
+        manager.parse_ticker_weights_text("AAPL:1.2.3, MSFT:0.4")
@@ -0,0 +1,36 @@
+"""
+Unit tests for the file storage service.
+"""
+import pytest
+
+from app.infrastructure.storage.file_storage import FileStorageService
+
+
+class _FileStorage(FileStorageService):
+    """FileStorageService with the document methods it doesn't implement stubbed out."""
+
+
+_FileStorage.__abstractmethods__ = frozenset()
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return _FileStorage(str(tmp_path))
+
+
+def test_copy_file_onto_itself_fails_without_truncating(storage, tmp_path):
+    source = tmp_path / 'data.bin'
+    source.write_bytes(b'x' * 4096)
+
+    assert storage.copy_file(str(source), str(source)) is False
+    assert source.read_bytes() == b'x' * 4096
+
+
+def test_copy_file_into_directory(storage, tmp_path):
+    source = tmp_path / 'data.bin'
+    source.write_bytes(b'payload')
+    target_dir = tmp_path / 'target'
+    target_dir.mkdir()
+
+    assert storage.copy_file(str(source), str(target_dir)) is True
+    assert (target_dir / 'data.bin').read_bytes() == b'payload'
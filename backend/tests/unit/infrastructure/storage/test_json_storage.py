@@ -0,0 +1,104 @@
+"""
+Unit tests for the JSON storage service.
+"""
+import pytest
+
+from app.infrastructure.storage import json_storage
+from app.infrastructure.storage.json_storage import JsonStorageService, METADATA_INDEX_FILENAME
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return JsonStorageService(str(tmp_path))
+
+
+def _portfolio(name):
+    return {'name': name, 'assets': [{'ticker': 'AAPL', 'weight': 1.0}], 'tags': ['core']}
+
+
+def _stored_names(tmp_path, subdir='portfolios'):
+    return sorted(path.name for path in (tmp_path / subdir).iterdir())
+
+
+def test_listing_reflects_saves_and_deletes(storage):
+    storage.save_portfolio(_portfolio('Alpha'), 'p1')
+    assert [item['name'] for item in storage.list_portfolios()] == ['Alpha']
+
+    storage.save_portfolio(_portfolio('Beta version'), 'p1')
+    storage.save_portfolio(_portfolio('Gamma'), 'p2')
+    assert [item['name'] for item in storage.list_portfolios()] == ['Beta version', 'Gamma']
+
+    assert storage.delete_portfolio('p1') is True
+    assert [item['id'] for item in storage.list_portfolios()] == ['p2']
+
+
+def test_persisted_index_is_revalidated_by_a_new_service(storage, tmp_path):
+    storage.save_portfolio(_portfolio('Alpha'), 'p1')
+    storage.save_portfolio(_portfolio('Gamma'), 'p2')
+    storage.list_portfolios()
+    assert (tmp_path / 'portfolios' / METADATA_INDEX_FILENAME).exists()
+
+    storage.save_portfolio(_portfolio('Beta version'), 'p1')
+    storage.delete_portfolio('p2')
+
+    reopened = JsonStorageService(str(tmp_path))
+    assert [(item['id'], item['name']) for item in reopened.list_portfolios()] == [('p1', 'Beta version')]
+
+
+def test_failed_write_keeps_previous_document(storage, tmp_path, monkeypatch):
+    storage.save_portfolio(_portfolio('Alpha'), 'p1')
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(json_storage.os, 'replace', fail)
+    with pytest.raises(OSError):
+        storage.save_portfolio(_portfolio('Beta'), 'p1')
+    monkeypatch.undo()
+
+    assert storage.load_portfolio('p1')['name'] == 'Alpha'
+    assert _stored_names(tmp_path) == ['p1.json']
+
+
+@pytest.mark.skipif(json_storage.ormsgpack is None, reason="ormsgpack is not installed")
+def test_msgpack_and_json_documents_round_trip(tmp_path):
+    msgpack_storage = JsonStorageService(str(tmp_path), storage_format='msgpack')
+    json_storage_service = JsonStorageService(str(tmp_path))
+    data = _portfolio('Alpha')
+
+    msgpack_storage.save_portfolio(dict(data), 'p1')
+    assert _stored_names(tmp_path) == ['p1.mpk']
+    loaded = json_storage_service.load_portfolio('p1')
+    assert {key: loaded[key] for key in data} == data
+    assert json_storage_service.list_portfolios()[0]['name'] == 'Alpha'
+
+    # Saving in the other format replaces the document instead of leaving two copies
+    json_storage_service.save_portfolio(dict(data, name='Beta'), 'p1')
+    assert [name for name in _stored_names(tmp_path) if name != METADATA_INDEX_FILENAME] == ['p1.json']
+    assert msgpack_storage.load_portfolio('p1')['name'] == 'Beta'
+
+
+def test_loaded_documents_are_copies(storage):
+    storage.save_portfolio(_portfolio('Alpha'), 'p1')
+
+    loaded = storage.load_portfolio('p1')
+    loaded['name'] = 'Changed'
+    loaded['assets'][0]['weight'] = 0.0
+    loaded['tags'].append('changed')
+
+    reloaded = storage.load_portfolio('p1')
+    assert reloaded['name'] == 'Alpha'
+    assert reloaded['assets'][0]['weight'] == 1.0
+    assert reloaded['tags'] == ['core']
+
+
+def test_save_many_with_duplicate_ids_keeps_the_last_item(storage, tmp_path):
+    ids = storage.save_many('scenario', [('s1', {'name': 'First'}), ('s2', {'name': 'Other'}), ('s1', {'name': 'Last'})])
+
+    assert ids == ['s1', 's2', 's1']
+    assert storage.load_object('scenario', 's1')['name'] == 'Last'
+    assert _stored_names(tmp_path, 'scenarios') == ['s1.json', 's2.json']
+    assert storage.load_many('scenario', ['s2', 's1']) == {
+        's2': storage.load_object('scenario', 's2'),
+        's1': storage.load_object('scenario', 's1')
+    }
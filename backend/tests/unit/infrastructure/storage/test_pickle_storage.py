@@ -0,0 +1,105 @@
+"""
+Unit tests for the pickle storage service.
+"""
+import json
+import os
+import pickle
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.infrastructure.storage import pickle_storage
+from app.infrastructure.storage.pickle_storage import PickleStorageService
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return PickleStorageService(str(tmp_path))
+
+
+def test_array_round_trip_is_writable(storage):
+    cov = np.random.rand(200, 200)
+    storage.save_portfolio({'name': 'A', 'cov': cov}, 'a')
+
+    loaded = storage.load_portfolio('a')['cov']
+    assert np.array_equal(loaded, cov)
+
+    loaded[0, 0] = -1.0
+    assert storage.load_portfolio('a')['cov'][0, 0] == cov[0, 0]
+
+
+def test_resave_keeps_previously_loaded_arrays_intact(storage):
+    big = np.arange(4_000_000, dtype=np.float64)
+    storage.save_portfolio({'name': 'A', 'values': big}, 'a')
+    loaded = storage.load_portfolio('a')['values']
+
+    storage.save_portfolio({'name': 'A', 'values': np.arange(10, dtype=np.float64)}, 'a')
+
+    assert loaded[-1] == big[-1]
+    assert np.array_equal(loaded, big)
+    assert len(storage.load_portfolio('a')['values']) == 10
+
+
+def test_plain_pickles_still_load(storage, tmp_path):
+    with open(tmp_path / 'portfolios' / 'legacy.pkl', 'wb') as f:
+        pickle.dump({'id': 'legacy', 'name': 'Legacy', 'values': np.ones(3)}, f)
+
+    data = storage.load_portfolio('legacy')
+    assert data['name'] == 'Legacy'
+    assert np.array_equal(data['values'], np.ones(3))
+
+
+def test_save_leaves_no_temporary_files(storage, tmp_path):
+    storage.save_portfolio({'name': 'A', 'values': np.ones(1000)}, 'a')
+
+    names = sorted(path.name for path in (tmp_path / 'portfolios').iterdir())
+    assert names == ['a.meta.json', 'a.pkl']
+
+
+def test_listing_reads_json_sidecars(storage, tmp_path, monkeypatch):
+    storage.save_portfolio({'name': 'A', 'tags': ['tech'], 'assets': [{'ticker': 'AAPL'}], 'values': np.ones(3)}, 'a')
+
+    with open(tmp_path / 'portfolios' / 'a.meta.json') as f:
+        sidecar = json.load(f)
+    assert sidecar['fields']['tags'] == ['tech']
+    assert sidecar['sizes']['assets'] == 1
+
+    def fail(file_path):
+        raise AssertionError(f"unexpected pickle load of {file_path}")
+
+    monkeypatch.setattr(pickle_storage, '_load_pickle', fail)
+    [listed] = storage.list_portfolios()
+    assert listed['name'] == 'A'
+    assert listed['tags'] == ['tech']
+    assert listed['asset_count'] == 1
+    assert isinstance(listed['created_at'], datetime)
+
+
+def test_listing_rebuilds_missing_and_damaged_sidecars(storage, tmp_path):
+    portfolios = tmp_path / 'portfolios'
+    with open(portfolios / 'legacy.pkl', 'wb') as f:
+        pickle.dump({'id': 'legacy', 'name': 'Legacy', 'assets': []}, f)
+    storage.save_portfolio({'name': 'A', 'assets': []}, 'a')
+    (portfolios / 'a.meta.json').write_text('{not json')
+
+    assert sorted(item['name'] for item in storage.list_portfolios()) == ['A', 'Legacy']
+    assert json.loads((portfolios / 'legacy.meta.json').read_text())['fields']['name'] == 'Legacy'
+    assert json.loads((portfolios / 'a.meta.json').read_text())['fields']['name'] == 'A'
+
+
+@pytest.mark.skipif(not os.path.isdir('/proc/self/fd'), reason="needs /proc/self/fd")
+def test_load_does_not_keep_the_file_open(storage, tmp_path):
+    storage.save_portfolio({'name': 'A', 'values': np.arange(100_000, dtype=np.float64)}, 'a')
+    pickle_path = str(tmp_path / 'portfolios' / 'a.pkl')
+
+    loaded = storage.load_portfolio('a')['values']
+
+    open_paths = []
+    for fd in os.listdir('/proc/self/fd'):
+        try:
+            open_paths.append(os.readlink(f'/proc/self/fd/{fd}'))
+        except OSError:
+            pass
+    assert pickle_path not in open_paths
+    assert loaded[-1] == 99_999.0